@@ -1,20 +1,36 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
-import shutil
-import tempfile
+import math
 from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
 import streamlit as st
 
 from src.analysis.data_structures import MeetingReport
-from src.analysis.pipeline import build_meeting_report
+from src.analysis.exports import EXPORT_FORMATS, exports_for, report_fingerprint
+from src.analysis.pipeline import analyze_uploads
+from src.utils.paging import PAGE_SIZES, Page, filter_records, paginate, sort_records
 
 SAMPLE_TRANSCRIPT = Path("data/samples/meetingbank_housing_snippet.jsonl")
 SAMPLE_REPORT = Path("data/samples/meetingbank_housing_snippet_report.json")
 
+# Sort label -> (record field, descending)
+ACTION_SORTS: Dict[str, Tuple[Optional[str], bool]] = {
+    "Original order": (None, False),
+    "Owner (A→Z)": ("responsible", False),
+    "Owner (Z→A)": ("responsible", True),
+    "Deadline (soonest first)": ("deadline", False),
+    "Deadline (latest first)": ("deadline", True),
+}
+DECISION_SORTS: Dict[str, Tuple[Optional[str], bool]] = {
+    "Original order": (None, False),
+    "Decision (A→Z)": ("decision", False),
+}
+
 st.set_page_config(page_title="Meeting Intelligence Dashboard", layout="wide", page_icon="📋")
 
 # Enhanced modern styling with proper light/dark mode support
@@ -336,6 +352,75 @@ def _image_to_base64(path: str) -> str:
         return ""
     return base64.b64encode(data).decode("utf-8")
 
+
+def _analysis_key(
+    transcript: Union[Path, Tuple[str, bytes]],
+    images: Sequence[Tuple[str, bytes]],
+    *options: object,
+) -> str:
+    """Hash of the analysis inputs; reruns with the same key reuse the stored report."""
+    digest = hashlib.sha1()
+    if isinstance(transcript, Path):
+        digest.update(f"{transcript.resolve()}:{transcript.stat().st_mtime_ns}".encode("utf-8"))
+    else:
+        digest.update(transcript[0].encode("utf-8"))
+        digest.update(transcript[1])
+    for name, content in images:
+        digest.update(name.encode("utf-8"))
+        digest.update(content)
+    digest.update(repr(options).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _log_page(
+    prefix: str,
+    records: List[dict],
+    fingerprint: str,
+    sorts: Dict[str, Tuple[Optional[str], bool]],
+    owner_field: Optional[str] = None,
+) -> Page:
+    """Filter, sort and paginate a log server-side; callers render only the returned page."""
+    cols = st.columns([3, 2, 2, 1])
+    query = cols[0].text_input("Search", key=f"{prefix}_query", placeholder="Filter by text…")
+    cached = st.session_state.get(f"{prefix}_view")
+    owner, owners = None, []
+    if owner_field:
+        # Owner options depend only on the report; reuse them until its fingerprint changes
+        if cached is not None and cached[0][0] == fingerprint:
+            owners = cached[2]
+        else:
+            owners = sorted({record[owner_field] for record in records if record[owner_field]})
+        choice = cols[1].selectbox(
+            "Owner", ["All owners", "Unassigned", *owners], key=f"{prefix}_owner"
+        )
+        owner = None if choice == "All owners" else "" if choice == "Unassigned" else choice
+    sort_label = cols[2].selectbox("Sort by", list(sorts), key=f"{prefix}_sort")
+    page_size = cols[3].selectbox("Per page", PAGE_SIZES, index=1, key=f"{prefix}_page_size")
+
+    # Re-filter and re-sort only when the inputs change, not on every page flip
+    view_key = (fingerprint, query, owner, sort_label)
+    if cached is None or cached[0] != view_key:
+        field, descending = sorts[sort_label]
+        matching = filter_records(records, query, owner=owner, owner_field=owner_field or "")
+        cached = (view_key, sort_records(matching, field, descending), owners)
+        st.session_state[f"{prefix}_view"] = cached
+    view = cached[1]
+
+    pages = max(1, math.ceil(len(view) / page_size))
+    page_key = f"{prefix}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    number = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, key=page_key)
+    page = paginate(view, int(number), page_size)
+    if page.total:
+        filtered = f" (filtered from {len(records)})" if page.total < len(records) else ""
+        st.caption(
+            f"Showing {page.start + 1}–{page.start + len(page.records)} of {page.total}{filtered}"
+        )
+    else:
+        st.caption(f"No matches among {len(records)} items.")
+    return page
+
 st.markdown(
     """
     <div class="meeting-hero">
@@ -358,54 +443,67 @@ if mode == "Rapid demo (cached)":
         st.error("Cached sample report missing. Please run a custom analysis to regenerate it.")
         st.stop()
     st.sidebar.success("✅ Loaded cached MeetingBank snippet – no model runtime needed.")
-    cached_payload = json.loads(SAMPLE_REPORT.read_text(encoding="utf-8"))
-    report = MeetingReport.from_dict(cached_payload)
+    analysis_key = f"demo:{SAMPLE_REPORT.stat().st_mtime_ns}"
+    analysis = st.session_state.get("analysis")
+    if analysis is None or analysis[0] != analysis_key:
+        cached_payload = json.loads(SAMPLE_REPORT.read_text(encoding="utf-8"))
+        report = MeetingReport.from_dict(cached_payload)
+        analysis = (analysis_key, report, report_fingerprint(report))
+        st.session_state["analysis"] = analysis
 else:
-    tmp_root = Path(tempfile.mkdtemp(prefix="meeting_dash_"))
-    try:
-        st.sidebar.markdown("### 📄 Transcript source")
-        use_sample = st.sidebar.checkbox(
-            "Use built-in MeetingBank snippet", value=False, help="Runs the lightweight snippet file."
-        )
+    st.sidebar.markdown("### ⚡ Latency tier")
+    tier_label = st.sidebar.radio(
+        "Extraction",
+        ["Model (best recall)", "Fast rules (sub-second)"],
+        help="Fast rules extract actions and decisions with patterns instead of FLAN-T5/DistilBART.",
+    )
+    tier = "fast" if tier_label.startswith("Fast") else "model"
+    escalate = tier == "fast" and st.sidebar.checkbox(
+        "Escalate uncertain chunks to models",
+        value=False,
+        help="Re-run only chunks the rules are unsure about through the model tier.",
+    )
 
-        transcript_file = None
-        transcript_path: Path
-        if use_sample:
-            transcript_path = SAMPLE_TRANSCRIPT
-            jsonl_limit = 5
-        else:
-            transcript_file = st.sidebar.file_uploader("Transcript (txt/jsonl)", type=["txt", "jsonl"])
-            if transcript_file is None:
-                st.info("📤 Upload a transcript or toggle the built-in snippet to get started.")
-                st.stop()
-            transcript_path = tmp_root / Path(transcript_file.name).name
-            transcript_path.write_bytes(transcript_file.read())
-            jsonl_limit = None
-
-        st.sidebar.markdown("### 🖼️ Optional screenshots")
-        image_files = st.sidebar.file_uploader(
-            "Screenshots (png/jpg)", type=["png", "jpg", "jpeg", "webp"], accept_multiple_files=True
-        )
+    st.sidebar.markdown("### 📄 Transcript source")
+    use_sample = st.sidebar.checkbox(
+        "Use built-in MeetingBank snippet", value=False, help="Runs the lightweight snippet file."
+    )
 
-        image_dir = tmp_root / "images"
-        if image_files:
-            image_dir.mkdir(exist_ok=True)
-            for file in image_files:
-                content = file.read()
-                target = image_dir / file.name
-                target.write_bytes(content)
-        else:
-            image_dir = None
+    if use_sample:
+        transcript_source = SAMPLE_TRANSCRIPT
+        jsonl_limit = 5
+    else:
+        transcript_file = st.sidebar.file_uploader("Transcript (txt/jsonl)", type=["txt", "jsonl"])
+        if transcript_file is None:
+            st.info("📤 Upload a transcript or toggle the built-in snippet to get started.")
+            st.stop()
+        transcript_source = (transcript_file.name, transcript_file.read())
+        jsonl_limit = None
+
+    st.sidebar.markdown("### 🖼️ Optional screenshots")
+    image_files = st.sidebar.file_uploader(
+        "Screenshots (png/jpg)", type=["png", "jpg", "jpeg", "webp"], accept_multiple_files=True
+    )
+    image_uploads = [(file.name, file.read()) for file in image_files or []]
 
+    # Widget interactions (paging, filters, exports) rerun the script; only new
+    # inputs or options should re-run the models
+    analysis_key = _analysis_key(transcript_source, image_uploads, jsonl_limit, tier, escalate)
+    analysis = st.session_state.get("analysis")
+    if analysis is None or analysis[0] != analysis_key:
         with st.spinner("🔄 Running meeting analysis..."):
-            report = build_meeting_report(
-                transcript_path,
-                image_dir,
+            report = analyze_uploads(
+                transcript_source,
+                image_uploads,
                 jsonl_limit=jsonl_limit,
+                tier=tier,
+                escalate=escalate,
             )
-    finally:
-        if tmp_root and tmp_root.exists():
-            shutil.rmtree(tmp_root, ignore_errors=True)
+        # Fingerprinted once per analysis; it keys the export memo and log views
+        analysis = (analysis_key, report, report_fingerprint(report))
+        st.session_state["analysis"] = analysis
+
+report, report_key = analysis[1], analysis[2]
 
 # Extract data from report
 action_records = report.action_records()
@@ -455,22 +553,28 @@ with summary_tab:
 with actions_tab:
     if action_records:
         st.markdown("### 📊 Action Items Overview")
-        action_df = pd.DataFrame(action_records)
-        st.dataframe(action_df, width='stretch', hide_index=True)
-        
-        st.markdown("### 👥 Owner Timeline")
-        for item in action_records:
+        action_page = _log_page(
+            "actions", action_records, report_key, ACTION_SORTS, owner_field="responsible"
+        )
+        if action_page.records:
+            st.dataframe(pd.DataFrame(action_page.records), width='stretch', hide_index=True)
+
+            st.markdown("### 👥 Owner Timeline")
+            # One markdown element per page rather than one per item
             st.markdown(
-                f"""
-                <div class="insight-card">
-                    <h4>{item['action_item']}</h4>
-                    <div class="timeline-meta">
-                        <span>👤 {item['responsible'] or 'Unassigned'}</span>
-                        <span>🗓️ {item['deadline'] or 'No date'}</span>
+                "".join(
+                    f"""
+                    <div class="insight-card">
+                        <h4>{item['action_item']}</h4>
+                        <div class="timeline-meta">
+                            <span>👤 {item['responsible'] or 'Unassigned'}</span>
+                            <span>🗓️ {item['deadline'] or 'No date'}</span>
+                        </div>
+                        <div class="support-card">{item['support'] or 'No supporting quote recorded.'}</div>
                     </div>
-                    <div class="support-card">{item['support'] or 'No supporting quote recorded.'}</div>
-                </div>
-                """,
+                    """
+                    for item in action_page.records
+                ),
                 unsafe_allow_html=True,
             )
     else:
@@ -479,18 +583,21 @@ with actions_tab:
 with decisions_tab:
     if decision_records:
         st.markdown("### 📊 Decisions Overview")
-        decision_df = pd.DataFrame(decision_records)
-        st.dataframe(decision_df, width='stretch', hide_index=True)
-        
-        st.markdown("### 🎯 Decision Highlights")
-        for item in decision_records:
+        decision_page = _log_page("decisions", decision_records, report_key, DECISION_SORTS)
+        if decision_page.records:
+            st.dataframe(pd.DataFrame(decision_page.records), width='stretch', hide_index=True)
+
+            st.markdown("### 🎯 Decision Highlights")
             st.markdown(
-                f"""
-                <div class="insight-card">
-                    <h4>{item['decision']}</h4>
-                    <div class="support-card">{item['support'] or 'No supporting quote recorded.'}</div>
-                </div>
-                """,
+                "".join(
+                    f"""
+                    <div class="insight-card">
+                        <h4>{item['decision']}</h4>
+                        <div class="support-card">{item['support'] or 'No supporting quote recorded.'}</div>
+                    </div>
+                    """
+                    for item in decision_page.records
+                ),
                 unsafe_allow_html=True,
             )
     else:
@@ -528,43 +635,38 @@ with visuals_tab:
 
 with exports_tab:
     st.markdown("### 💾 Shareable Downloads")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if action_records:
-            st.download_button(
-                label="📥 Download Action Items (CSV)",
-                data=pd.DataFrame(action_records).to_csv(index=False),
-                file_name="actions.csv",
-                mime="text/csv",
-                width='stretch',
-            )
-    
-    with col2:
-        if decision_records:
+
+    # Payloads are only built for the format being downloaded, then memoized per report
+    export_col, prepare_col = st.columns([3, 1])
+    export_key = export_col.selectbox(
+        "Export format",
+        list(EXPORT_FORMATS),
+        format_func=lambda key: EXPORT_FORMATS[key].label,
+    )
+    if prepare_col.button("⚙️ Prepare", width='stretch'):
+        st.session_state["prepared_export"] = (report_key, export_key)
+
+    if st.session_state.get("prepared_export") == (report_key, export_key):
+        export_format = EXPORT_FORMATS[export_key]
+        try:
+            payload = exports_for(report, report_key).build(export_key)
+        except ImportError as exc:
+            st.error(str(exc))
+        else:
             st.download_button(
-                label="📥 Download Decisions (CSV)",
-                data=pd.DataFrame(decision_records).to_csv(index=False),
-                file_name="decisions.csv",
-                mime="text/csv",
+                label=f"📥 Download {export_format.label}",
+                data=payload,
+                file_name=export_format.file_name,
+                mime=export_format.mime,
+                on_click="ignore",
                 width='stretch',
             )
-    
-    with col3:
-        st.download_button(
-            label="📥 Download Summary (MD)",
-            data=report.as_markdown_table().encode("utf-8"),
-            file_name="meeting_summary.md",
-            mime="text/markdown",
-            width='stretch',
-        )
-    
+
     st.markdown(
         """
         <div class="support-card">
-            <strong>📤 Export Options:</strong> Download action items and decisions as CSV for easy import into project management tools, or get the full summary as Markdown for documentation.
+            <strong>📤 Export Options:</strong> Download action items and decisions as CSV or Parquet for easy import into project management tools, the full summary as Markdown for documentation, or everything at once as a ZIP bundle.
         </div>
         """,
         unsafe_allow_html=True,
-    )
\ No newline at end of file
+    )
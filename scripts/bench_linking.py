@@ -0,0 +1,101 @@
+"""Time caption-to-chunk linking on a synthetic transcript.
+
+Words are drawn with Zipf frequencies from a vocabulary of ``--vocab``
+pseudo-words, so both a repetitive meeting and a varied day-long hearing can
+be simulated. Reports the best ``link_visuals`` time over ``--repeats`` runs,
+the time of the per-chunk regex + Counter tokenization it replaced, and the
+tracemalloc peak of one linking run.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from itertools import accumulate
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analysis.data_structures import VisualInsight  # noqa: E402
+from src.analysis.linking import _term_counts, link_visuals  # noqa: E402
+from src.utils.text import iter_chunks  # noqa: E402
+
+SYLLABLES = "ba be bi bo bu da de di do du ka ke ki ko ku la le li lo lu ma me mi mo mu na ne ni no nu".split()
+
+
+def make_vocab(size: int, rng: random.Random) -> list:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_transcript(vocab: list, target_chars: int, rng: random.Random) -> str:
+    cum_weights = list(accumulate(1.0 / rank for rank in range(1, len(vocab) + 1)))
+    lines, size = [], 0
+    while size < target_chars:
+        words = rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(8, 30))
+        line = f"Speaker {rng.randint(1, 9)}: " + " ".join(words) + "."
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--chunks", type=int, default=4100, help="Approximate chunk count")
+    parser.add_argument("--chunk-chars", type=int, default=3500)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--vocab", type=int, default=20000)
+    parser.add_argument("--captions", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = make_vocab(args.vocab, rng)
+    step = max(1, args.chunk_chars - args.overlap)
+    text = make_transcript(vocab, args.chunks * step, rng)
+    chunks = list(iter_chunks(text, max_chars=args.chunk_chars, overlap=args.overlap))
+    captions = [" ".join(rng.choices(vocab, k=8)) for _ in range(args.captions)]
+
+    def visuals() -> list:
+        return [VisualInsight(f"slide_{idx}.png", caption) for idx, caption in enumerate(captions)]
+
+    link_seconds = []
+    for _ in range(args.repeats):
+        batch = visuals()
+        start = time.perf_counter()
+        link_visuals(batch, chunks)
+        link_seconds.append(time.perf_counter() - start)
+    start = time.perf_counter()
+    for chunk in chunks:
+        _term_counts(chunk.content)
+    regex_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    link_visuals(visuals(), chunks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        json.dumps(
+            {
+                "chunks": len(chunks),
+                "transcript_chars": len(text),
+                "vocab": args.vocab,
+                "captions": args.captions,
+                "link_seconds": round(min(link_seconds), 3),
+                "regex_counter_tokenize_seconds": round(regex_seconds, 3),
+                "link_peak_mb": round(peak / (1024 * 1024), 1),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
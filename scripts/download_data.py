@@ -1,53 +1,158 @@
+import argparse
 import json
 import shutil
 import subprocess
 from pathlib import Path
+from typing import Dict, List, Optional
 
-from datasets import load_dataset
+from datasets import DatasetDict, load_dataset, load_from_disk
 
 
 DATA_DIR = Path("data")
 MISED_REPO = "https://github.com/google-research-datasets/MISeD.git"
 PUBLIC_MEETINGS_REPO = "https://github.com/pltrdy/public_meetings.git"
+MEETINGBANK_DATASET = "lytang/MeetingBank-transcript"
+MANIFEST_NAME = "manifest.json"
+COMPRESSION_SUFFIX = {None: "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+
+def _git(*args: str, cwd: Optional[Path] = None) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    )
+    return result.stdout.strip()
 
 
 def clone_repo(url: str, target: Path) -> None:
+    """Clone ``url`` into ``target``, or fast-forward an existing clone in place."""
+    if (target / ".git").exists():
+        before = _git("rev-parse", "HEAD", cwd=target)
+        _git("fetch", "--prune", "origin", cwd=target)
+        _git("merge", "--ff-only", "@{upstream}", cwd=target)
+        after = _git("rev-parse", "HEAD", cwd=target)
+        if before == after:
+            print(f"{target} already current at {after[:12]}")
+        else:
+            print(f"Updated {target} {before[:12]} -> {after[:12]}")
+        return
     if target.exists():
+        # Leftover from an interrupted clone or a non-git copy; start over
         shutil.rmtree(target)
     subprocess.run(["git", "clone", url, str(target)], check=True)
     print(f"Cloned {url} -> {target}")
 
 
-def download_mised() -> None:
-    clone_repo(MISED_REPO, DATA_DIR / "mised")
+def download_mised(url: str = MISED_REPO) -> None:
+    clone_repo(url, DATA_DIR / "mised")
+
+
+def download_public_meetings(url: str = PUBLIC_MEETINGS_REPO) -> None:
+    clone_repo(url, DATA_DIR / "public_meetings")
+
+
+def _load_meetingbank(source: str) -> DatasetDict:
+    source_path = Path(source)
+    if source_path.is_dir() and (source_path / "dataset_dict.json").exists():
+        return load_from_disk(str(source_path))
+    return load_dataset(source)
+
 
+def _shard_paths(target_dir: Path, split: str, shards: int, compression: Optional[str]) -> List[Path]:
+    suffix = ".jsonl" + COMPRESSION_SUFFIX[compression]
+    if shards == 1:
+        return [target_dir / f"{split}{suffix}"]
+    return [target_dir / f"{split}-{idx:05d}-of-{shards:05d}{suffix}" for idx in range(shards)]
 
-def download_public_meetings() -> None:
-    clone_repo(PUBLIC_MEETINGS_REPO, DATA_DIR / "public_meetings")
 
+def _split_files(target_dir: Path, split: str) -> List[Path]:
+    """Existing export files for ``split``, including leftovers from interrupted runs."""
+    patterns = [f"{split}.jsonl*", f"{split}-*-of-*.jsonl*"]
+    return sorted({path for pattern in patterns for path in target_dir.glob(pattern)})
 
-def download_meetingbank() -> None:
+
+def _read_manifest(target_dir: Path) -> Dict[str, dict]:
+    path = target_dir / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        return {}
+
+
+def download_meetingbank(
+    source: str = MEETINGBANK_DATASET,
+    shards: int = 1,
+    compression: Optional[str] = None,
+    num_proc: Optional[int] = None,
+) -> None:
+    """Export every MeetingBank split to JSONL, skipping splits that are already current.
+
+    A split is current when the manifest records the same dataset fingerprint,
+    shard count and compression, and all of its files are still on disk.
+    Compressed and sharded files are plain JSONL streams that ``load_transcript``
+    reads one file at a time; indexed lookups (``load_meeting``, long mode with a
+    meeting id) need an uncompressed single-file export.
+    """
+    if shards <= 0:
+        raise ValueError("shards must be positive")
+    if compression not in COMPRESSION_SUFFIX:
+        raise ValueError(f"Unsupported compression: {compression}")
     target_dir = DATA_DIR / "meetingbank"
-    if target_dir.exists():
-        shutil.rmtree(target_dir)
-    target_dir.mkdir(parents=True)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(target_dir)
 
-    dataset = load_dataset("lytang/MeetingBank-transcript")
+    dataset = _load_meetingbank(source)
     for split, split_ds in dataset.items():
-        split_path = target_dir / f"{split}.jsonl"
-        with split_path.open("w", encoding="utf-8") as fp:
-            for record in split_ds:
-                fp.write(json.dumps(record, ensure_ascii=False) + "\n")
-        print(f"Saved MeetingBank split '{split}' with {len(split_ds)} rows -> {split_path}")
+        split_shards = max(1, min(shards, len(split_ds)))
+        paths = _shard_paths(target_dir, split, split_shards, compression)
+        # ``_fingerprint`` is private to ``datasets``; without it a split cannot be
+        # proven unchanged, so it is always exported again
+        fingerprint = getattr(split_ds, "_fingerprint", None)
+        entry = {
+            "fingerprint": fingerprint,
+            "rows": len(split_ds),
+            "shards": split_shards,
+            "compression": compression,
+            "files": [path.name for path in paths],
+        }
+        if (
+            fingerprint is not None
+            and manifest.get(split) == entry
+            and all(path.exists() for path in paths)
+        ):
+            print(f"MeetingBank split '{split}' already current ({len(split_ds)} rows)")
+            continue
+
+        for stale in _split_files(target_dir, split):
+            stale.unlink()
+        for idx, path in enumerate(paths):
+            shard = (
+                split_ds
+                if split_shards == 1
+                else split_ds.shard(split_shards, idx, contiguous=True)
+            )
+            tmp_path = path.with_name(path.name + ".tmp")
+            # Arrow-backed batch writer; far faster than json.dumps per record
+            shard.to_json(
+                str(tmp_path),
+                lines=True,
+                force_ascii=False,
+                compression=compression,
+                num_proc=num_proc,
+            )
+            tmp_path.replace(path)
+        manifest[split] = entry
+        # Persist after every split so an interrupted run keeps finished work
+        (target_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        print(f"Saved MeetingBank split '{split}' with {len(split_ds)} rows -> {len(paths)} file(s)")
 
 
 def create_sample_images() -> None:
     from PIL import Image, ImageDraw
 
     images_dir = DATA_DIR / "sample_images"
-    if images_dir.exists():
-        shutil.rmtree(images_dir)
-    images_dir.mkdir(parents=True)
+    images_dir.mkdir(parents=True, exist_ok=True)
 
     specs = [
         ("project_update.png", "Q4 Launch\nRoadmap"),
@@ -55,19 +160,45 @@ def create_sample_images() -> None:
     ]
 
     for filename, text in specs:
+        path = images_dir / filename
+        if path.exists():
+            continue
         img = Image.new("RGB", (1200, 675), color="#1f2933")
         draw = ImageDraw.Draw(img)
         draw.text((80, 120), text, fill="#f8fafc")
-        path = images_dir / filename
         img.save(path)
         print(f"Created sample image -> {path}")
 
 
-def main() -> None:
-    DATA_DIR.mkdir(exist_ok=True)
-    download_mised()
-    download_public_meetings()
-    download_meetingbank()
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch or refresh the meeting datasets.")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--mised-url", default=MISED_REPO, help="Git URL or local path")
+    parser.add_argument("--public-meetings-url", default=PUBLIC_MEETINGS_REPO, help="Git URL or local path")
+    parser.add_argument(
+        "--meetingbank-source",
+        default=MEETINGBANK_DATASET,
+        help="Hub dataset id or a local directory (save_to_disk output or data files)",
+    )
+    parser.add_argument("--shards", type=int, default=1, help="JSONL shards per split")
+    parser.add_argument("--compression", choices=["gzip", "bz2", "xz"], default=None)
+    parser.add_argument("--num-proc", type=int, default=None, help="Processes for JSONL export")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    global DATA_DIR
+    args = parse_args(argv)
+    DATA_DIR = args.data_dir
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    download_mised(args.mised_url)
+    download_public_meetings(args.public_meetings_url)
+    download_meetingbank(
+        args.meetingbank_source,
+        shards=args.shards,
+        compression=args.compression,
+        num_proc=args.num_proc,
+    )
     create_sample_images()
 
 
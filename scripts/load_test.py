@@ -0,0 +1,242 @@
+"""Simulate concurrent Custom analysis sessions and report latency, throughput and memory.
+
+Every request goes through ``analyze_uploads`` — the same path ``app.py`` uses
+for uploaded transcripts and screenshots. By default the registry is switched
+to stub pipelines so the run is offline and deterministic; ``--backend hf``
+uses the real (or ``--model``-overridden, e.g. tiny local) checkpoints.
+"""
+import argparse
+import io
+import json
+import math
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analysis.long_transcript import current_rss_mb  # noqa: E402
+from src.analysis.pipeline import analyze_uploads, load_transcript  # noqa: E402
+from src.utils.budgets import budget_stats, set_adaptive_budgets  # noqa: E402
+from src.utils.model_registry import (  # noqa: E402
+    MODEL_REGISTRY,
+    batching_stats,
+    set_pipeline_factory,
+)
+from src.utils.resources import get_resource_manager  # noqa: E402
+from src.utils.stub_models import stub_factory  # noqa: E402
+
+SAMPLE_TRANSCRIPT = Path("data/samples/meetingbank_housing_snippet.jsonl")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def make_transcript(base: str, size: int) -> Tuple[str, bytes]:
+    """A plaintext upload of roughly ``size`` characters built from real meeting text."""
+    repeats = size // max(1, len(base)) + 1
+    return (f"transcript_{size}.txt", ("\n".join([base] * repeats))[:size].encode("utf-8"))
+
+
+def make_images(count: int, side: int, seed: int) -> List[Tuple[str, bytes]]:
+    if count == 0:
+        return []
+    from PIL import Image, ImageDraw
+
+    rng = random.Random(seed)
+    images = []
+    for idx in range(count):
+        img = Image.new("RGB", (side, side * 9 // 16), color=(rng.randrange(256), 40, 60))
+        ImageDraw.Draw(img).text((40, 40), f"Slide {idx}\nOwner: Team {idx}", fill="#ffffff")
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        images.append((f"slide_{idx}.png", buffer.getvalue()))
+    return images
+
+
+class MemorySampler(threading.Thread):
+    """Track peak RSS while the load runs."""
+
+    def __init__(self, interval: float = 0.05) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak_mb = current_rss_mb()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, current_rss_mb())
+
+    def stop(self) -> float:
+        self._stop_event.set()
+        self.join()
+        return max(self.peak_mb, current_rss_mb())
+
+
+def run_load(
+    sessions: int,
+    requests_per_session: int,
+    transcript_sizes: List[int],
+    image_counts: List[int],
+    image_side: int,
+    think_ms: float,
+    seed: int,
+) -> Dict[str, object]:
+    base = load_transcript(SAMPLE_TRANSCRIPT)
+    transcripts = {size: make_transcript(base, size) for size in transcript_sizes}
+    image_sets = {count: make_images(count, image_side, seed) for count in image_counts}
+
+    results: List[dict] = []
+    results_lock = threading.Lock()
+    start_barrier = threading.Barrier(sessions)
+
+    def session(index: int) -> None:
+        rng = random.Random(seed + index)
+        start_barrier.wait()
+        for _ in range(requests_per_session):
+            size = rng.choice(transcript_sizes)
+            count = rng.choice(image_counts)
+            started = time.perf_counter()
+            error: Optional[str] = None
+            try:
+                analyze_uploads(transcripts[size], image_sets[count])
+            except Exception as exc:  # record and keep the session going
+                error = f"{type(exc).__name__}: {exc}"
+            latency = time.perf_counter() - started
+            with results_lock:
+                results.append(
+                    {
+                        "session": index,
+                        "chars": size,
+                        "images": count,
+                        "latency": latency,
+                        "error": error,
+                    }
+                )
+            if think_ms:
+                time.sleep(rng.uniform(0, think_ms) / 1000.0)
+
+    sampler = MemorySampler()
+    sampler.start()
+    threads = [threading.Thread(target=session, args=(idx,)) for idx in range(sessions)]
+    wall_start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    peak_mb = sampler.stop()
+
+    ok = [row["latency"] for row in results if row["error"] is None]
+    by_mix: Dict[str, List[float]] = {}
+    for row in results:
+        if row["error"] is None:
+            mix = f"{row['chars']}chars_{row['images']}images"
+            by_mix.setdefault(mix, []).append(row["latency"])
+
+    def summary(values: List[float]) -> Dict[str, float]:
+        return {
+            "count": len(values),
+            "mean_ms": round(1000 * sum(values) / len(values), 2) if values else 0.0,
+            "p50_ms": round(1000 * percentile(values, 50), 2),
+            "p90_ms": round(1000 * percentile(values, 90), 2),
+            "p95_ms": round(1000 * percentile(values, 95), 2),
+            "p99_ms": round(1000 * percentile(values, 99), 2),
+            "max_ms": round(1000 * max(values), 2) if values else 0.0,
+        }
+
+    return {
+        "config": {
+            "sessions": sessions,
+            "requests_per_session": requests_per_session,
+            "transcript_sizes": transcript_sizes,
+            "image_counts": image_counts,
+            "image_side": image_side,
+            "think_ms": think_ms,
+            "seed": seed,
+        },
+        "requests": len(results),
+        "errors": [row["error"] for row in results if row["error"]],
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(len(ok) / wall, 3) if wall else 0.0,
+        "latency": summary(ok),
+        "latency_by_mix": {mix: summary(values) for mix, values in sorted(by_mix.items())},
+        "queueing": {name: stats.to_dict() for name, stats in batching_stats().items()},
+        "generation_budgets": {name: stats.to_dict() for name, stats in budget_stats().items()},
+        "cpu": get_resource_manager().utilization(),
+        "peak_rss_mb": round(peak_mb, 1),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sessions", type=int, default=8, help="Concurrent simulated users")
+    parser.add_argument("--requests", type=int, default=3, help="Analyses per session")
+    parser.add_argument("--transcript-sizes", type=int, nargs="+", default=[2000, 10000, 40000])
+    parser.add_argument("--image-counts", type=int, nargs="+", default=[0, 2])
+    parser.add_argument("--image-side", type=int, default=1280, help="Synthetic screenshot width (px)")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="Max random pause between requests")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=["stub", "hf"], default="stub")
+    parser.add_argument("--stub-base-ms", type=float, default=20.0)
+    parser.add_argument("--stub-item-ms", type=float, default=5.0)
+    parser.add_argument("--stub-kchar-ms", type=float, default=2.0)
+    parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        metavar="ALIAS=PATH",
+        help="Override a registry checkpoint, e.g. summarizer=./models/tiny-bart",
+    )
+    parser.add_argument(
+        "--fixed-budgets",
+        action="store_true",
+        help="Use the registry's fixed generation limits instead of per-chunk budgets",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here as well as stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    for override in args.model:
+        alias, _, model = override.partition("=")
+        if alias not in MODEL_REGISTRY or not model:
+            raise SystemExit(f"Bad --model override: {override}")
+        MODEL_REGISTRY[alias]["model"] = model
+    set_adaptive_budgets(not args.fixed_budgets)
+    if args.backend == "stub":
+        set_pipeline_factory(
+            stub_factory(args.stub_base_ms, args.stub_item_ms, args.stub_kchar_ms)
+        )
+
+    report = run_load(
+        sessions=args.sessions,
+        requests_per_session=args.requests,
+        transcript_sizes=args.transcript_sizes,
+        image_counts=args.image_counts,
+        image_side=args.image_side,
+        think_ms=args.think_ms,
+        seed=args.seed,
+    )
+    report["config"]["backend"] = args.backend
+    report["config"]["adaptive_budgets"] = not args.fixed_budgets
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare pre-warmed forked workers against per-process model loading.
+
+``fork`` mode loads the registry models once in the parent and forks workers
+that share the weights copy-on-write; ``spawn`` mode starts fresh interpreters
+that each load their own copy (today's behaviour for separate processes). For
+each mode the script reports time until every worker has served one warm-up
+request, plus RSS/PSS per process. Summed PSS is the real combined footprint.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils.model_registry import MODEL_REGISTRY, get_batcher, set_pipeline_factory  # noqa: E402
+from src.utils.prewarm import PrewarmedWorkers, prewarm, process_memory  # noqa: E402
+from src.utils.resources import get_resource_manager  # noqa: E402
+from src.utils.stub_models import stub_factory  # noqa: E402
+
+SAMPLE_TEXT = (
+    "Speaker 1: Staff will publish the rental assistance FAQ by Friday.\n"
+    "Speaker 2: The motion carries unanimously."
+)
+
+
+def configure_backend(config: Dict[str, Any]) -> None:
+    for alias, model in config["models"].items():
+        MODEL_REGISTRY[alias]["model"] = model
+    if config["backend"] == "stub":
+        set_pipeline_factory(stub_factory(weights_mb=config["stub_weights_mb"]))
+
+
+def warm_up(aliases: List[str]) -> None:
+    """One request per alias, so lazily initialised state is counted too."""
+    from PIL import Image
+
+    for alias in aliases:
+        if MODEL_REGISTRY[alias]["task"] == "image-to-text":
+            get_batcher(alias).submit(Image.new("RGB", (64, 64))).result()
+        else:
+            get_batcher(alias).submit(SAMPLE_TEXT).result()
+
+
+def serve(index: int, aliases: List[str], ready: Any, stop: Any) -> None:
+    warm_up(aliases)
+    ready.put({"worker": index, "ready_at": time.monotonic()})
+    stop.wait()
+
+
+def spawn_worker(
+    index: int, num_workers: int, config: Dict[str, Any], aliases: List[str], ready: Any, stop: Any
+) -> None:
+    configure_backend(config)
+    get_resource_manager().configure_worker(index, num_workers)
+    prewarm(aliases)
+    serve(index, aliases, ready, stop)
+
+
+def run(mode: str, num_workers: int, aliases: List[str], config: Dict[str, Any]) -> Dict[str, Any]:
+    ctx = mp.get_context(mode)
+    ready, stop = ctx.Queue(), ctx.Event()
+    started = time.monotonic()
+    pool: Optional[PrewarmedWorkers] = None
+    if mode == "fork":
+        configure_backend(config)
+        pool = PrewarmedWorkers(num_workers, aliases=aliases).start(serve, aliases, ready, stop)
+        processes = pool.processes
+    else:
+        processes = [
+            ctx.Process(target=spawn_worker, args=(idx, num_workers, config, aliases, ready, stop))
+            for idx in range(num_workers)
+        ]
+        for process in processes:
+            process.start()
+
+    ready_at = sorted(ready.get(timeout=config["timeout"])["ready_at"] for _ in processes)
+    memory = {
+        "parent": process_memory(),
+        "workers": [process_memory(process.pid) for process in processes],
+    }
+    stop.set()
+    for process in processes:
+        process.join()
+
+    pss_total = sum(m.get("pss_mb", 0.0) for m in [memory["parent"], *memory["workers"]])
+    return {
+        "mode": mode,
+        "workers": num_workers,
+        "aliases": aliases,
+        "parent_load_seconds": pool.load_seconds if pool else {},
+        "fork_seconds": pool.fork_seconds if pool else None,
+        "first_ready_seconds": round(ready_at[0] - started, 3),
+        "all_ready_seconds": round(ready_at[-1] - started, 3),
+        "memory": memory,
+        "total_pss_mb": round(pss_total, 1),
+        "exit_codes": [process.exitcode for process in processes],
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mode", choices=["fork", "spawn", "both"], default="both")
+    parser.add_argument("--alias", action="append", choices=sorted(MODEL_REGISTRY), dest="aliases")
+    parser.add_argument("--backend", choices=["stub", "hf"], default="hf")
+    parser.add_argument(
+        "--stub-weights-mb", type=float, default=250.0, help="Fake weight size per stub pipeline"
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        metavar="ALIAS=PATH",
+        help="Override a registry checkpoint, e.g. summarizer=./models/tiny-bart",
+    )
+    parser.add_argument("--timeout", type=float, default=900.0, help="Seconds to wait per worker")
+    parser.add_argument("--output", type=Path, help="Write JSON results here as well as stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    models = {}
+    for override in args.model:
+        alias, _, model = override.partition("=")
+        if alias not in MODEL_REGISTRY or not model:
+            raise SystemExit(f"Bad --model override: {override}")
+        models[alias] = model
+    config = {
+        "backend": args.backend,
+        "stub_weights_mb": args.stub_weights_mb,
+        "models": models,
+        "timeout": args.timeout,
+    }
+    aliases = args.aliases or list(MODEL_REGISTRY)
+    # Spawn first: the fork run freezes and loads models into this process
+    modes = ["spawn", "fork"] if args.mode == "both" else [args.mode]
+    payload = json.dumps([run(mode, args.workers, aliases, config) for mode in modes], indent=2)
+    if args.output:
+        args.output.write_text(payload, encoding="utf-8")
+    print(payload)
+
+
+if __name__ == "__main__":
+    main()
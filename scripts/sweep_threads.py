@@ -0,0 +1,43 @@
+"""Find the fastest torch intra-op thread count per model alias on this machine."""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.analysis.pipeline import load_transcript  # noqa: E402
+from src.analysis.transcript import ACTION_PROMPT, DECISION_PROMPT  # noqa: E402
+from src.utils.model_registry import sweep_threads  # noqa: E402
+from src.utils.resources import get_resource_manager  # noqa: E402
+from src.utils.text import chunk_text  # noqa: E402
+
+SAMPLE_TRANSCRIPT = Path("data/samples/meetingbank_housing_snippet.jsonl")
+PROMPTS = {
+    "summarizer": "",
+    "action_generator": f"{ACTION_PROMPT}\nTranscript:\n",
+    "decision_generator": f"{DECISION_PROMPT}\nTranscript:\n",
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--alias", action="append", choices=sorted(PROMPTS), help="Repeatable")
+    parser.add_argument("--transcript", type=Path, default=SAMPLE_TRANSCRIPT)
+    parser.add_argument("--batch", type=int, default=4, help="Chunks per timed batch")
+    parser.add_argument("--threads", type=int, nargs="*", help="Candidate intra-op counts")
+    parser.add_argument("--repeats", type=int, default=2)
+    args = parser.parse_args()
+
+    chunks = [chunk.content for chunk in chunk_text(load_transcript(args.transcript))][: args.batch]
+    results = {}
+    for alias in args.alias or sorted(PROMPTS):
+        inputs = [PROMPTS[alias] + chunk for chunk in chunks]
+        results[alias] = sweep_threads(
+            alias, inputs, candidates=args.threads, repeats=args.repeats
+        )
+    print(json.dumps({"sweeps": results, "utilization": get_resource_manager().utilization()}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
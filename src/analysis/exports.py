@@ -0,0 +1,199 @@
+"""Lazily built, memoized export payloads for meeting reports."""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from .data_structures import MeetingReport
+
+ACTION_COLUMNS = ["action_item", "responsible", "deadline", "support"]
+DECISION_COLUMNS = ["decision", "support"]
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    label: str
+    file_name: str
+    mime: str
+    builder: str
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    "actions_csv": ExportFormat("Action Items (CSV)", "actions.csv", "text/csv", "actions_csv"),
+    "decisions_csv": ExportFormat("Decisions (CSV)", "decisions.csv", "text/csv", "decisions_csv"),
+    "markdown": ExportFormat("Summary (MD)", "meeting_summary.md", "text/markdown", "markdown"),
+    "json": ExportFormat(
+        "Full Report (JSON)", "meeting_report.json", "application/json", "report_json"
+    ),
+    "bundle": ExportFormat(
+        "Bundle (ZIP: CSV + MD + JSON)", "meeting_export.zip", "application/zip", "bundle"
+    ),
+    "actions_parquet": ExportFormat(
+        "Action Items (Parquet)", "actions.parquet", "application/octet-stream", "actions_parquet"
+    ),
+    "decisions_parquet": ExportFormat(
+        "Decisions (Parquet)", "decisions.parquet", "application/octet-stream", "decisions_parquet"
+    ),
+}
+
+
+def _csv_bytes(records: List[dict], columns: List[str]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(records)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _parquet_bytes(records: List[dict], columns: List[str]) -> bytes:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from exc
+    schema = pa.schema([(col, pa.string()) for col in columns])
+    table = pa.table(
+        {col: [str(record.get(col, "")) for record in records] for col in columns}, schema=schema
+    )
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    return buffer.getvalue()
+
+
+def _write_report_entries(archive: zipfile.ZipFile, report: MeetingReport, prefix: str = "") -> None:
+    archive.writestr(f"{prefix}actions.csv", _csv_bytes(report.action_records(), ACTION_COLUMNS))
+    archive.writestr(
+        f"{prefix}decisions.csv", _csv_bytes(report.decision_records(), DECISION_COLUMNS)
+    )
+    archive.writestr(f"{prefix}meeting_summary.md", report.as_markdown_table().encode("utf-8"))
+    archive.writestr(
+        f"{prefix}meeting_report.json",
+        json.dumps(report.to_dict(), ensure_ascii=False, indent=2).encode("utf-8"),
+    )
+
+
+class ReportExports:
+    """Export payloads for one report; each format is built on first access only."""
+
+    def __init__(self, report: MeetingReport) -> None:
+        self.report = report
+
+    def build(self, key: str) -> bytes:
+        if key not in EXPORT_FORMATS:
+            raise KeyError(f"Unknown export format: {key}")
+        return getattr(self, EXPORT_FORMATS[key].builder)
+
+    @cached_property
+    def actions_csv(self) -> bytes:
+        return _csv_bytes(self.report.action_records(), ACTION_COLUMNS)
+
+    @cached_property
+    def decisions_csv(self) -> bytes:
+        return _csv_bytes(self.report.decision_records(), DECISION_COLUMNS)
+
+    @cached_property
+    def markdown(self) -> bytes:
+        return self.report.as_markdown_table().encode("utf-8")
+
+    @cached_property
+    def report_json(self) -> bytes:
+        return json.dumps(self.report.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+
+    @cached_property
+    def bundle(self) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            _write_report_entries(archive, self.report)
+        return buffer.getvalue()
+
+    @cached_property
+    def actions_parquet(self) -> bytes:
+        return _parquet_bytes(self.report.action_records(), ACTION_COLUMNS)
+
+    @cached_property
+    def decisions_parquet(self) -> bytes:
+        return _parquet_bytes(self.report.decision_records(), DECISION_COLUMNS)
+
+
+def report_fingerprint(report: MeetingReport) -> str:
+    """Content hash so equal reports rebuilt on a rerun share memoized exports."""
+    payload = json.dumps(report.to_dict(), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+_EXPORT_CACHE: "OrderedDict[str, ReportExports]" = OrderedDict()
+_EXPORT_CACHE_SIZE = 8
+# Streamlit runs each session's script on its own thread
+_EXPORT_CACHE_LOCK = threading.Lock()
+
+
+def exports_for(report: MeetingReport, fingerprint: str | None = None) -> ReportExports:
+    """Return the memoized :class:`ReportExports` for ``report``'s content."""
+    key = fingerprint or report_fingerprint(report)
+    with _EXPORT_CACHE_LOCK:
+        if key in _EXPORT_CACHE:
+            _EXPORT_CACHE.move_to_end(key)
+            return _EXPORT_CACHE[key]
+        exports = ReportExports(report)
+        _EXPORT_CACHE[key] = exports
+        while len(_EXPORT_CACHE) > _EXPORT_CACHE_SIZE:
+            _EXPORT_CACHE.popitem(last=False)
+        return exports
+
+
+def write_batch_bundle(reports: Iterable[Tuple[str, MeetingReport]], target: Path) -> Path:
+    """Stream many reports into one zip, one folder per meeting.
+
+    ``reports`` may be a generator; each report is written and released before
+    the next one is pulled, so memory stays bounded by the largest meeting.
+    """
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, report in reports:
+            _write_report_entries(archive, report, prefix=f"{name}/")
+    return target
+
+
+def write_batch_parquet(reports: Iterable[Tuple[str, MeetingReport]], target_dir: Path) -> List[Path]:
+    """Stream many reports into ``actions.parquet`` and ``decisions.parquet``.
+
+    Each report becomes one row group tagged with a ``meeting`` column.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from exc
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    specs = {
+        "actions": (ACTION_COLUMNS, MeetingReport.action_records),
+        "decisions": (DECISION_COLUMNS, MeetingReport.decision_records),
+    }
+    schemas = {
+        kind: pa.schema([("meeting", pa.string())] + [(col, pa.string()) for col in columns])
+        for kind, (columns, _) in specs.items()
+    }
+    paths = {kind: target_dir / f"{kind}.parquet" for kind in specs}
+    writers = {kind: pq.ParquetWriter(paths[kind], schemas[kind]) for kind in specs}
+    try:
+        for name, report in reports:
+            for kind, (columns, records_fn) in specs.items():
+                records = records_fn(report)
+                if not records:
+                    continue
+                data = {"meeting": [name] * len(records)}
+                data.update({col: [str(rec.get(col, "")) for rec in records] for col in columns})
+                writers[kind].write_table(pa.table(data, schema=schemas[kind]))
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return list(paths.values())
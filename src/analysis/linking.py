@@ -0,0 +1,198 @@
+"""Link screenshot captions to the transcript chunks they talk about."""
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .data_structures import VisualInsight
+from .transcript import Chunk
+
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9]+")
+# Caption boilerplate and function words carry no topical signal
+STOPWORDS = frozenset(
+    """
+    a an and are as at be been but by for from has have he her his i if in into is it its
+    of on or our she so that the their them there they this to was we were what when which
+    who will with you your speaker image picture photo slide screen shot screenshot
+    text showing shows shown display displayed meeting whiteboard board there's
+    """.split()
+)
+
+
+# bytes.translate table: [a-z0-9] bytes are kept, every other byte becomes a space
+_RUN_BYTES = bytes(byte if 97 <= byte <= 122 or 48 <= byte <= 57 else 32 for byte in range(256))
+# Chunks are counted together in blocks of about this many characters
+_BLOCK_CHARS = 1 << 18
+# Chunks scored per matrix product against the captions
+_SCORE_CHUNKS = 1024
+
+
+def _run_term(run: bytes) -> Optional[str]:
+    """The ``_TOKEN_RE`` match inside one ``[a-z0-9]`` run, or None for none/a stopword."""
+    term = run.lstrip(b"0123456789").decode("ascii")
+    return term if len(term) >= 2 and term not in STOPWORDS else None
+
+
+def _blocks(chunks: Iterable[Chunk]) -> Iterator[List[str]]:
+    block: List[str] = []
+    size = 0
+    for chunk in chunks:
+        text = chunk.content
+        block.append(text)
+        size += len(text)
+        if size >= _BLOCK_CHARS:
+            yield block
+            block, size = [], 0
+    if block:
+        yield block
+
+
+def _block_counts(
+    texts: List[str], run_terms: Dict[bytes, int], term_ids: Dict[str, int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(chunk index, term id, count) for every term occurring in a block of chunks.
+
+    Gives the same counts as ``_term_counts`` per chunk. Splitting on bytes and
+    counting with ``np.unique`` avoids a regex scan and a Counter per chunk.
+    Each distinct run is turned into a term once and cached in ``run_terms``
+    (-1 for no term); new terms get the next id in ``term_ids``.
+    """
+    runs = [text.lower().encode("utf-8").translate(_RUN_BYTES).split() for text in texts]
+    rows = np.repeat(np.arange(len(texts)), [len(chunk_runs) for chunk_runs in runs])
+    flat = list(chain.from_iterable(runs))
+    for run in sorted(set(flat).difference(run_terms)):
+        term = _run_term(run)
+        run_terms[run] = -1 if term is None else term_ids.setdefault(term, len(term_ids))
+    ids = np.fromiter(map(run_terms.__getitem__, flat), dtype=np.int64, count=len(flat))
+    keep = ids >= 0
+    # Runs like "3rd" and "rd" give the same term, so count by term id, not by run
+    width = max(1, len(term_ids))
+    pairs, counts = np.unique(rows[keep] * width + ids[keep], return_counts=True)
+    return pairs // width, pairs % width, counts
+
+
+def _term_counts(text: str) -> Counter:
+    counts = Counter(_TOKEN_RE.findall(text.lower()))
+    for word in STOPWORDS.intersection(counts):
+        del counts[word]
+    return counts
+
+
+def _dense_rows(
+    entries: Tuple[np.ndarray, np.ndarray, np.ndarray], lo: int, hi: int, width: int
+) -> np.ndarray:
+    """Dense caption-vocabulary vectors for chunks ``lo`` to ``hi`` from sparse entries."""
+    rows, cols, values = entries
+    start, end = np.searchsorted(rows, [lo, hi])
+    out = np.zeros((hi - lo, width), dtype=np.float32)
+    out[rows[start:end] - lo, cols[start:end]] = values[start:end]
+    return out
+
+
+def _sublinear(counts: Iterable[int]) -> np.ndarray:
+    # Sublinear tf keeps a repeated word from dominating a long chunk
+    return 1.0 + np.log(np.fromiter(counts, dtype=np.float32))
+
+
+def link_visuals(
+    visuals: List[VisualInsight],
+    chunks: Iterable[Chunk],
+    top_k: int = 3,
+    min_score: float = 0.05,
+    terms_per_link: int = 2,
+) -> List[VisualInsight]:
+    """Fill ``linked_topics`` with the transcript chunks most similar to each caption.
+
+    Chunks are tokenized in one streaming pass, a block of chunks at a time,
+    into compact (chunk, term id, weight) arrays; idf, chunk norms and the
+    caption-vocabulary projection are then computed with numpy, and every
+    caption is scored against every chunk in a single matrix product. Each
+    link reads ``"chunk N: term / term"`` with the shared terms that
+    contributed most.
+    """
+    if not visuals:
+        return visuals
+    caption_counts = [_term_counts(visual.caption) for visual in visuals]
+    vocab = sorted({term for counts in caption_counts for term in counts})
+    if not vocab:
+        return visuals
+
+    # Single streaming pass over blocks of chunks: (chunk, term id, count) triples
+    run_terms: Dict[bytes, int] = {}
+    term_ids: Dict[str, int] = {}
+    row_parts: List[np.ndarray] = []
+    id_parts: List[np.ndarray] = []
+    count_parts: List[np.ndarray] = []
+    n_chunks = 0
+    for texts in _blocks(chunks):
+        rows, ids, counts = _block_counts(texts, run_terms, term_ids)
+        row_parts.append(n_chunks + rows)
+        id_parts.append(ids)
+        count_parts.append(counts.astype(np.float32))
+        n_chunks += len(texts)
+    if n_chunks == 0:
+        return visuals
+
+    rows = np.concatenate(row_parts)
+    ids = np.concatenate(id_parts)
+    weights = 1.0 + np.log(np.concatenate(count_parts))
+
+    # Smoothed idf as in scikit-learn; chunk norms use the full chunk vocabulary
+    doc_freq = np.bincount(ids, minlength=len(term_ids))
+    idf = (np.log((1 + n_chunks) / (1 + doc_freq)) + 1.0).astype(np.float32)
+    tfidf = weights * idf[ids]
+    norms = np.sqrt(np.bincount(rows, weights=tfidf * tfidf, minlength=n_chunks))
+    norms[norms == 0] = 1.0
+
+    # Project chunks onto the caption vocabulary; other terms cannot add to a dot product
+    column_of = np.full(len(term_ids) + 1, -1, dtype=np.int64)
+    vocab_idf = np.empty(len(vocab), dtype=np.float32)
+    for col, term in enumerate(vocab):
+        term_id = term_ids.get(term)
+        if term_id is not None:
+            column_of[term_id] = col
+            vocab_idf[col] = idf[term_id]
+        else:
+            vocab_idf[col] = math.log(1 + n_chunks) + 1.0
+    cols = column_of[ids]
+    keep = cols >= 0
+    # Sparse (chunk, column, weight) entries, ordered by chunk
+    entries = (rows[keep], cols[keep], tfidf[keep] / norms[rows[keep]])
+
+    query = np.zeros((len(visuals), len(vocab)), dtype=np.float32)
+    column = {term: col for col, term in enumerate(vocab)}
+    for row, counts in enumerate(caption_counts):
+        if counts:
+            query[row, [column[term] for term in counts]] = _sublinear(counts.values())
+    query *= vocab_idf
+    query_norms = np.linalg.norm(query, axis=1, keepdims=True)
+    query /= np.where(query_norms == 0, 1.0, query_norms)
+
+    # (captions x chunks) cosine similarities, a block of chunks at a time
+    scores = np.empty((len(visuals), n_chunks), dtype=np.float32)
+    for lo in range(0, n_chunks, _SCORE_CHUNKS):
+        hi = min(n_chunks, lo + _SCORE_CHUNKS)
+        scores[:, lo:hi] = query @ _dense_rows(entries, lo, hi, len(vocab)).T
+    k = min(top_k, n_chunks)
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    for row, visual in enumerate(visuals):
+        ranked = sorted(best[row], key=lambda col: -scores[row, col])
+        links = []
+        for chunk_idx in ranked:
+            if scores[row, chunk_idx] < min_score:
+                continue
+            vector = _dense_rows(entries, chunk_idx, chunk_idx + 1, len(vocab))[0]
+            contribution = query[row] * vector
+            top_terms = [
+                vocab[idx]
+                for idx in np.argsort(-contribution)[:terms_per_link]
+                if contribution[idx] > 0
+            ]
+            links.append(f"chunk {chunk_idx + 1}: {' / '.join(top_terms)}")
+        visual.linked_topics = links
+    return visuals
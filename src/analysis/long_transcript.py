@@ -0,0 +1,201 @@
+"""Bounded-memory processing for very long transcripts (day-long hearings)."""
+from __future__ import annotations
+
+import gc
+import json
+import shutil
+import sys
+import tempfile
+from dataclasses import asdict
+from itertools import islice
+from pathlib import Path
+from typing import IO, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module
+    resource = None
+
+from ..utils.jsonl_index import JsonlReader, is_jsonl, open_jsonl
+from ..utils.text import ChunkView, MappedText, iter_chunks
+from .data_structures import ActionItem, DecisionPoint, MeetingReport
+from .linking import link_visuals
+from .rules import tier_stages
+from .tracking import dedupe_action_items
+from .vision import analyze_images
+
+
+class MemoryBudgetExceeded(RuntimeError):
+    """Raised when resident memory passes the configured ceiling."""
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MiB (current on Linux, peak elsewhere)."""
+    if resource is None:
+        return 0.0
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as fp:
+            pages = int(fp.read().split()[1])
+        return pages * resource.getpagesize() / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS and KiB on Linux/BSD
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class RssGuard:
+    """Check RSS against ``max_rss_mb`` between stages; ``None`` disables the ceiling."""
+
+    def __init__(self, max_rss_mb: Optional[float] = None) -> None:
+        self.max_rss_mb = max_rss_mb
+        self.peak_mb = current_rss_mb()
+
+    def check(self, stage: str) -> None:
+        rss = current_rss_mb()
+        if self.max_rss_mb is not None and rss > self.max_rss_mb:
+            gc.collect()  # give freed model outputs a chance before failing
+            rss = current_rss_mb()
+            if rss > self.max_rss_mb:
+                raise MemoryBudgetExceeded(
+                    f"RSS {rss:.0f} MiB exceeds ceiling {self.max_rss_mb:.0f} MiB after {stage}"
+                )
+        self.peak_mb = max(self.peak_mb, rss)
+
+
+def spool_transcript(
+    path: Path,
+    spill_dir: Path,
+    limit: int | None = None,
+    meeting_id: str | None = None,
+) -> Path:
+    """Return a plaintext file for ``path`` without loading it fully into memory.
+
+    JSONL rows are streamed into ``spill_dir`` one ``source`` field at a time;
+    plaintext transcripts are used in place.
+    """
+    if not path.exists():
+        raise FileNotFoundError(path)
+    if not is_jsonl(path) and meeting_id is None:
+        return path
+
+    target = spill_dir / "transcript.txt"
+    with target.open("w", encoding="utf-8") as out:
+        if meeting_id is not None:
+            with JsonlReader(path) as reader:
+                if meeting_id not in reader.index.ids:
+                    raise KeyError(f"Unknown meeting id: {meeting_id}")
+                for idx, line_no in enumerate(reader.index.ids[meeting_id]):
+                    out.write(("\n" if idx else "") + reader.line(line_no).get("source", ""))
+            return target
+        written = 0
+        with open_jsonl(path) as fp:
+            for idx, line in enumerate(fp):
+                if limit is not None and idx >= limit:
+                    break
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                out.write(("\n" if written else "") + obj.get("source", ""))
+                written += 1
+    return target
+
+
+def _groups(chunks: Iterator[ChunkView], size: int) -> Iterator[List[ChunkView]]:
+    while True:
+        group = list(islice(chunks, size))
+        if not group:
+            return
+        yield group
+
+
+def _spill(fp: IO[str], record: dict) -> None:
+    record["actions"] = [asdict(item) for item in record["actions"]]
+    fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def _iter_spill(spill_path: Path) -> Iterator[dict]:
+    with spill_path.open("r", encoding="utf-8") as fp:
+        for line in fp:
+            yield json.loads(line)
+
+
+def build_long_meeting_report(
+    transcript_path: Path,
+    image_dir: Optional[Path] = None,
+    jsonl_limit: int | None = None,
+    meeting_id: str | None = None,
+    spill_dir: Optional[Path] = None,
+    max_rss_mb: Optional[float] = None,
+    group_size: int = 4,
+    max_chars: int = 3500,
+    overlap: int = 200,
+    tier: str = "model",
+    escalate: bool = False,
+    rss_guard: Optional[RssGuard] = None,
+) -> MeetingReport:
+    """Stream chunks through every stage and spill per-chunk results to disk.
+
+    At most ``group_size`` chunks (and their model inputs/outputs) are alive at
+    once, so peak memory does not grow with transcript length. Only the final
+    report, which is the output itself, is assembled in memory. Pass
+    ``rss_guard`` to read its ``peak_mb`` afterwards; its ceiling then
+    replaces ``max_rss_mb``.
+    """
+    if group_size <= 0:
+        raise ValueError("group_size must be positive")
+    summarize_chunks, extract_actions, extract_decisions = tier_stages(tier, escalate)
+    owns_spill = spill_dir is None
+    work_dir = Path(tempfile.mkdtemp(prefix="meeting_spill_")) if owns_spill else spill_dir
+    work_dir.mkdir(parents=True, exist_ok=True)
+    guard = rss_guard if rss_guard is not None else RssGuard(max_rss_mb)
+    try:
+        text_path = spool_transcript(
+            transcript_path, work_dir, limit=jsonl_limit, meeting_id=meeting_id
+        )
+        guard.check("spooling transcript")
+        spill_path = work_dir / "chunks.jsonl"
+        with MappedText(text_path) as source, spill_path.open("w", encoding="utf-8") as spill:
+            chunks = iter_chunks(source, max_chars=max_chars, overlap=overlap)
+            # A group is spilled only after the next one is deduped against it, so a
+            # later duplicate can still fill in its blank owner or deadline
+            pending: Optional[dict] = None
+            for group in _groups(chunks, group_size):
+                record = {
+                    "start": group[0].start,
+                    "end": group[-1].end,
+                    "summaries": summarize_chunks(group),
+                    "actions": extract_actions(group),
+                    "decisions": [asdict(item) for item in extract_decisions(group)],
+                }
+                # Overlap duplicates come from neighbouring chunks: dedupe against the
+                # previous group's items only, so dedupe state stays bounded as well
+                previous = pending["actions"] if pending is not None else []
+                actions = dedupe_action_items(previous + record["actions"])
+                record["actions"] = actions[len(previous) :]
+                if pending is not None:
+                    pending["actions"] = actions[: len(previous)]
+                    _spill(spill, pending)
+                pending = record
+                del group, record, actions
+                guard.check("chunk group")
+            if pending is not None:
+                _spill(spill, pending)
+
+        report = MeetingReport(agenda_summary="", action_items=[], decisions=[], visuals=[])
+        summary_parts: List[str] = []
+        for record in _iter_spill(spill_path):
+            summary_parts.extend(record["summaries"])
+            report.action_items.extend(ActionItem(**item) for item in record["actions"])
+            report.decisions.extend(DecisionPoint(**item) for item in record["decisions"])
+        report.agenda_summary = " ".join(summary_parts)
+        if image_dir and image_dir.exists():
+            report.visuals = analyze_images(image_dir)
+            with MappedText(text_path) as source:
+                chunks = iter_chunks(source, max_chars=max_chars, overlap=overlap)
+                link_visuals(report.visuals, chunks)
+        guard.check("assembling report")
+        return report
+    finally:
+        if owns_spill:
+            shutil.rmtree(work_dir, ignore_errors=True)
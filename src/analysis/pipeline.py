@@ -2,29 +2,58 @@
 from __future__ import annotations
 
 import json
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence, Tuple, Union
 
+from ..utils.jsonl_index import JsonlReader, is_jsonl, open_jsonl
+from ..utils.text import iter_chunks
 from .data_structures import MeetingReport
-from .transcript import extract_action_items, extract_decisions, summarize_transcript
+from .linking import link_visuals
+from .long_transcript import RssGuard, build_long_meeting_report
+from .rules import tier_stages
+from .tracking import dedupe_action_items
 from .vision import analyze_images
 
 
-def load_transcript(path: Path, limit: int | None = None) -> str:
-    """Load transcript text from plaintext or JSON (MeetingBank-style) rows."""
+def load_meeting(path: Path, meeting_id: str | None = None, line: int | None = None) -> str:
+    """Load one meeting from a large JSONL corpus via its byte-offset index.
+
+    Pass either a ``meeting_id`` (all rows for that meeting) or a zero-based
+    ``line`` number. The sidecar index is built on first use and rebuilt when
+    the corpus file changes.
+    """
+    if (meeting_id is None) == (line is None):
+        raise ValueError("Pass exactly one of meeting_id or line")
+    with JsonlReader(path) as reader:
+        rows = reader.meeting(meeting_id) if meeting_id is not None else [reader.line(line)]
+    return "\n".join(row.get("source", "") for row in rows)
+
+
+def load_transcript(
+    path: Path, limit: int | None = None, meeting_id: str | None = None
+) -> str:
+    """Load transcript text from plaintext or JSON (MeetingBank-style) rows.
+
+    JSONL may be compressed (``.jsonl.gz``, ``.bz2``, ``.xz``); a sharded export
+    is read one shard file at a time.
+    """
     if not path.exists():
         raise FileNotFoundError(path)
-    if path.suffix == ".jsonl":
-        lines = path.read_text(encoding="utf-8").splitlines()
+    if meeting_id is not None:
+        return load_meeting(path, meeting_id=meeting_id)
+    if is_jsonl(path):
         parts = []
-        for idx, line in enumerate(lines):
-            if limit is not None and idx >= limit:
-                break
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            parts.append(obj.get("source", ""))
+        with open_jsonl(path) as fp:
+            for idx, line in enumerate(fp):
+                if limit is not None and idx >= limit:
+                    break
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                parts.append(obj.get("source", ""))
         return "\n".join(parts)
     return path.read_text(encoding="utf-8")
 
@@ -33,15 +62,79 @@ def build_meeting_report(
     transcript_path: Path,
     image_dir: Optional[Path] = None,
     jsonl_limit: int | None = None,
+    meeting_id: str | None = None,
+    long_transcript: bool = False,
+    max_rss_mb: float | None = None,
+    tier: str = "model",
+    escalate: bool = False,
+    rss_guard: Optional[RssGuard] = None,
 ) -> MeetingReport:
-    transcript_text = load_transcript(transcript_path, limit=jsonl_limit)
-    agenda_summary = summarize_transcript(transcript_text)
-    actions = extract_action_items(transcript_text)
-    decisions = extract_decisions(transcript_text)
+    """Build a report with the ``"model"`` tier or the rule-based ``"fast"`` tier.
+
+    In the fast tier ``escalate=True`` re-runs only low-confidence chunks
+    through the models.
+    """
+    summarize_chunks, extract_actions, extract_decisions = tier_stages(tier, escalate)
+    if long_transcript:
+        # Streams chunks and spills per-chunk results to disk; see long_transcript.py
+        return build_long_meeting_report(
+            transcript_path,
+            image_dir,
+            jsonl_limit=jsonl_limit,
+            meeting_id=meeting_id,
+            max_rss_mb=max_rss_mb,
+            tier=tier,
+            escalate=escalate,
+            rss_guard=rss_guard,
+        )
+    transcript_text = load_transcript(transcript_path, limit=jsonl_limit, meeting_id=meeting_id)
+    # Offset-only views: chunk once and share them across every stage
+    chunks = list(iter_chunks(transcript_text))
+    agenda_summary = " ".join(summarize_chunks(chunks))
+    # Overlapping chunks restate the same item; keep one copy
+    actions = dedupe_action_items(extract_actions(chunks))
+    decisions = extract_decisions(chunks)
     visuals = analyze_images(image_dir) if image_dir and image_dir.exists() else []
+    link_visuals(visuals, chunks)
     return MeetingReport(
         agenda_summary=agenda_summary,
         action_items=actions,
         decisions=decisions,
         visuals=visuals,
     )
+
+
+def analyze_uploads(
+    transcript: Union[Path, Tuple[str, bytes]],
+    images: Sequence[Tuple[str, bytes]] = (),
+    jsonl_limit: int | None = None,
+    tier: str = "model",
+    escalate: bool = False,
+) -> MeetingReport:
+    """Run the dashboard's Custom analysis path on in-memory uploads.
+
+    ``transcript`` is either an existing file (e.g. the built-in snippet) or an
+    uploaded ``(file_name, content)`` pair. Uploads are staged in a private
+    temp directory that is removed once the report is built.
+    """
+    tmp_root = Path(tempfile.mkdtemp(prefix="meeting_dash_"))
+    try:
+        if isinstance(transcript, Path):
+            transcript_path = transcript
+        else:
+            name, content = transcript
+            transcript_path = tmp_root / Path(name).name
+            transcript_path.write_bytes(content)
+
+        image_dir: Optional[Path] = None
+        if images:
+            image_dir = tmp_root / "images"
+            image_dir.mkdir(exist_ok=True)
+            for name, content in images:
+                (image_dir / Path(name).name).write_bytes(content)
+
+        return build_meeting_report(
+            transcript_path, image_dir, jsonl_limit=jsonl_limit, tier=tier, escalate=escalate
+        )
+    finally:
+        shutil.rmtree(tmp_root, ignore_errors=True)
@@ -0,0 +1,279 @@
+"""Model-free fast tier: compiled patterns for actions, owners, deadlines and decisions.
+
+Rules trade recall for latency — a report is built in milliseconds without
+loading FLAN-T5 or DistilBART. With ``escalate=True`` only the chunks the rules
+are unsure about are sent to the model tier.
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+
+from .data_structures import ActionItem, DecisionPoint
+from .linking import STOPWORDS
+from .transcript import (
+    Chunk,
+    extract_actions_from_chunks,
+    extract_actions_per_chunk,
+    extract_decisions_from_chunks,
+    extract_decisions_per_chunk,
+    summarize_chunks,
+)
+
+TIERS = ("model", "fast")
+# Chunks whose least certain rule match scores below this are escalated
+ESCALATION_THRESHOLD = 0.6
+MAX_SUPPORT_CHARS = 240
+
+_LINE = re.compile(r"^\s*(?:(?P<speaker>[A-Z][\w.'-]*(?: [\w.'-]+){0,3}):\s+)?(?P<text>.+)$", re.M)
+_SENTENCE = re.compile(r"[^.!?]+(?:[.!?]+|$)")
+_NAME = r"(?:the\s+)?[A-Z][\w&'-]*(?:\s+(?:of\s+)?[A-Z][\w&'-]*){0,3}"
+# Capitalised sentence openers that are never owners ("There will be", "It has to")
+_NON_OWNER = (
+    r"(?:It|Its|This|That|These|Those|There|Here|Then|What|Which|Who|Each|Every|Some|Any"
+    r"|All|Both|Our|My|Your|Their|His|Her|Everything|Something|Anything|Nothing)\b"
+)
+_OWNER = rf"(?!{_NON_OWNER}){_NAME}"
+# People, but not a name the report can assign a task to
+_PRONOUNS = frozenset(
+    "we he she they you someone somebody everyone everybody anyone anybody".split()
+)
+
+_WEEKDAY = r"(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+_MONTH = (
+    r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)"
+)
+_DEADLINE = re.compile(
+    r"\b(?:by|before|until|no later than|due(?:\s+(?:on|by))?)\s+(?P<deadline>"
+    rf"(?:(?:next|this|the end of(?: the)?|end of)\s+(?:{_WEEKDAY}|day|week|month|quarter|year|meeting))"
+    rf"|{_WEEKDAY}|tomorrow|tonight|today"
+    rf"|{_MONTH}\.?\s+\d{{1,2}}(?:st|nd|rd|th)?(?:,?\s+\d{{4}})?"
+    r"|\d{1,2}/\d{1,2}(?:/\d{2,4})?|q[1-4](?:\s+\d{4})?)"
+    r"|(?P<now>\b(?:immediately|asap|right away)\b)",
+    re.I,
+)
+
+# (pattern, base confidence); "owner" and "task" groups feed the ActionItem
+_ACTION_RULES: List[Tuple[re.Pattern, float]] = [
+    (
+        re.compile(
+            r"\b(?:(?i:assign(?:ed|s)?|direct(?:ed|s)?|ask(?:ed|s)?|authoriz(?:e|es|ed|ing)"
+            r"|request(?:ed|s)?|instruct(?:ed|s)?))\s+(?P<owner>" + _OWNER + r")\s+to\s+(?P<task>[^.!?]+)"
+        ),
+        0.5,
+    ),
+    (
+        re.compile(
+            r"(?P<owner>\b(?:I|we|" + _OWNER + r"))(?:'ll|\s+(?i:will|shall|(?:is|are|am) going to"
+            r"|needs? to|has to|have to|agreed to|(?:is|are|am) responsible for))"
+            r"\s+(?P<task>[^.!?]+)"
+        ),
+        0.4,
+    ),
+    (re.compile(r"(?i:\b(?:action item|to-?do|follow[- ]up)\s*[:\-])\s*(?P<task>[^.!?]+)"), 0.5),
+]
+# Phrases that suggest a task the rules could not parse
+_ACTION_HINT = re.compile(
+    r"\b(?:should|need to|needs to|let's|can you|could you|would you|make sure|deadline)\b", re.I
+)
+
+_DECISION_RULES: List[Tuple[re.Pattern, float]] = [
+    (
+        re.compile(
+            r"\bmotion\b[^.!?]*?\b(?:carries|carried|passes|passed|is approved|was approved"
+            r"|is adopted|was adopted|fails|failed)\b",
+            re.I,
+        ),
+        0.8,
+    ),
+    (
+        re.compile(
+            r"\b(?:we|council|committee|board|commission|the group|members)\s+(?:have\s+|has\s+)?"
+            r"(?:agreed|decided|approved|voted|adopted|resolved)\b",
+            re.I,
+        ),
+        0.8,
+    ),
+    (
+        re.compile(
+            r"\b(?:resolution|ordinance|item|recommendation|proposal|budget|contract)\b[^.!?]*?"
+            r"\b(?:is|was|are|were|has been|have been)\s+(?:approved|adopted|passed|rejected|denied)\b",
+            re.I,
+        ),
+        0.7,
+    ),
+    (re.compile(r"\b(?:unanimous(?:ly)?|so moved|without objection)\b", re.I), 0.5),
+]
+_DECISION_HINT = re.compile(
+    r"\b(?:motion|second(?:ed)?|roll call|vote|in favor|opposed|abstain)\b", re.I
+)
+
+_Item = TypeVar("_Item")
+
+
+def _sentences(text: str) -> Iterable[Tuple[str, str]]:
+    """(speaker, sentence) pairs; speaker is empty for unprefixed lines."""
+    for line in _LINE.finditer(text):
+        speaker = line.group("speaker") or ""
+        for sentence in _SENTENCE.findall(line.group("text")):
+            sentence = sentence.strip()
+            if sentence:
+                yield speaker, sentence
+
+
+def _support(speaker: str, sentence: str) -> str:
+    quote = f"{speaker}: {sentence}" if speaker else sentence
+    return quote if len(quote) <= MAX_SUPPORT_CHARS else quote[: MAX_SUPPORT_CHARS - 1] + "…"
+
+
+def _resolve_owner(owner: str, speaker: str) -> str:
+    if owner in ("I", "i"):
+        return speaker
+    if owner.lower() in _PRONOUNS:
+        return ""
+    return re.sub(r"^the\s+", "", owner, flags=re.I).strip()
+
+
+def rule_actions(text: str) -> Tuple[List[ActionItem], float]:
+    """Action items matched by rules plus the chunk's confidence in [0, 1]."""
+    items: List[ActionItem] = []
+    scores: List[float] = []
+    unmatched_hint = False
+    for speaker, sentence in _sentences(text):
+        for pattern, base in _ACTION_RULES:
+            match = pattern.search(sentence)
+            if match is None:
+                continue
+            task = match.group("task")
+            deadline_match = _DEADLINE.search(sentence)
+            deadline = ""
+            if deadline_match is not None:
+                deadline = deadline_match.group("deadline") or deadline_match.group("now")
+                task = task.replace(deadline_match.group(0), "")
+            task = " ".join(task.split()).rstrip(",;: ")
+            deadline = deadline.strip()
+            if len(task.split()) < 2:
+                continue
+            owner = _resolve_owner(match.groupdict().get("owner") or "", speaker)
+            items.append(
+                ActionItem(
+                    description=task[0].upper() + task[1:],
+                    owner=owner,
+                    deadline=deadline[:1].upper() + deadline[1:],
+                    support=_support(speaker, sentence),
+                )
+            )
+            score = base + (0.3 if owner else 0.0) + (0.3 if deadline else 0.0)
+            if "owner" in pattern.groupindex and not owner:
+                # The owner is what made this a task; a bare pronoun leaves it unsure
+                score = min(score, ESCALATION_THRESHOLD - 0.1)
+            scores.append(score)
+            break
+        else:
+            unmatched_hint = unmatched_hint or bool(_ACTION_HINT.search(sentence))
+    return items, _chunk_confidence(scores, unmatched_hint)
+
+
+def rule_decisions(text: str) -> Tuple[List[DecisionPoint], float]:
+    """Decisions and motions matched by rules plus the chunk's confidence in [0, 1]."""
+    decisions: List[DecisionPoint] = []
+    scores: List[float] = []
+    unmatched_hint = False
+    for speaker, sentence in _sentences(text):
+        for pattern, base in _DECISION_RULES:
+            if pattern.search(sentence):
+                decisions.append(
+                    DecisionPoint(summary=sentence, support=_support(speaker, sentence))
+                )
+                scores.append(base)
+                break
+        else:
+            unmatched_hint = unmatched_hint or bool(_DECISION_HINT.search(sentence))
+    return decisions, _chunk_confidence(scores, unmatched_hint)
+
+
+def _chunk_confidence(scores: List[float], unmatched_hint: bool) -> float:
+    # No matches and no hints: nothing to find, so the rules are confident
+    if not scores:
+        return 0.3 if unmatched_hint else 1.0
+    confidence = min(1.0, min(scores))
+    return min(confidence, 0.5) if unmatched_hint else confidence
+
+
+def _fast_extract(
+    chunks: Iterable[Chunk],
+    rules: Callable[[str], Tuple[List[_Item], float]],
+    model: Callable[[List[Chunk]], List[List[_Item]]],
+    escalate: bool,
+    threshold: float,
+) -> List[_Item]:
+    chunks = list(chunks)
+    per_chunk: List[List[_Item]] = []
+    unsure: List[int] = []
+    for idx, chunk in enumerate(chunks):
+        items, confidence = rules(chunk.content)
+        per_chunk.append(items)
+        if escalate and confidence < threshold:
+            unsure.append(idx)
+    if unsure:
+        # The model re-reads the whole chunk, so its answer replaces the rule matches
+        for idx, items in zip(unsure, model([chunks[idx] for idx in unsure])):
+            per_chunk[idx] = items
+    return [item for items in per_chunk for item in items]
+
+
+def extract_actions_fast(
+    chunks: Iterable[Chunk], escalate: bool = False, threshold: float = ESCALATION_THRESHOLD
+) -> List[ActionItem]:
+    return _fast_extract(chunks, rule_actions, extract_actions_per_chunk, escalate, threshold)
+
+
+def extract_decisions_fast(
+    chunks: Iterable[Chunk], escalate: bool = False, threshold: float = ESCALATION_THRESHOLD
+) -> List[DecisionPoint]:
+    return _fast_extract(chunks, rule_decisions, extract_decisions_per_chunk, escalate, threshold)
+
+
+def summarize_chunks_fast(chunks: Iterable[Chunk], min_words: int = 6) -> List[str]:
+    """Extractive summary: the most representative sentence of each chunk.
+
+    Sentences are scored by the average in-chunk frequency of their content
+    words, so the pick favours the chunk's recurring topic over small talk.
+    """
+    summaries: List[str] = []
+    for chunk in chunks:
+        sentences = [sentence for _, sentence in _sentences(chunk.content)]
+        tokens = [re.findall(r"[a-z][a-z0-9']+", sentence.lower()) for sentence in sentences]
+        freq = Counter(word for words in tokens for word in words if word not in STOPWORDS)
+        best: Optional[str] = None
+        best_score = -1.0
+        for sentence, words in zip(sentences, tokens):
+            if len(words) < min_words:
+                continue
+            score = sum(freq[word] for word in words if word not in STOPWORDS) / len(words)
+            if score > best_score:
+                best, best_score = sentence, score
+        if best is not None:
+            summaries.append(best)
+    return summaries
+
+
+def tier_stages(
+    tier: str = "model", escalate: bool = False
+) -> Tuple[
+    Callable[[List[Chunk]], List[str]],
+    Callable[[List[Chunk]], List[ActionItem]],
+    Callable[[List[Chunk]], List[DecisionPoint]],
+]:
+    """(summarize, actions, decisions) stage functions for a latency tier."""
+    if tier == "model":
+        return summarize_chunks, extract_actions_from_chunks, extract_decisions_from_chunks
+    if tier == "fast":
+        return (
+            summarize_chunks_fast,
+            lambda chunks: extract_actions_fast(chunks, escalate=escalate),
+            lambda chunks: extract_decisions_fast(chunks, escalate=escalate),
+        )
+    raise ValueError(f"Unknown tier {tier!r}; expected one of {TIERS}")
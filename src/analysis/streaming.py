@@ -0,0 +1,153 @@
+"""Live meeting mode: incremental analysis of utterances as they arrive."""
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from ..utils.text import IncrementalChunker, TextChunk
+from .data_structures import ActionItem, DecisionPoint, MeetingReport
+from .tracking import dedupe_action_items
+from .transcript import (
+    extract_actions_from_chunks,
+    extract_decisions_from_chunks,
+    summarize_chunks,
+)
+
+
+class StreamingMeetingSession:
+    """Accumulate utterances and keep a partial :class:`MeetingReport` up to date.
+
+    Only windows closed since the last update go through the models. If the
+    open tail has waited longer than ``max_latency`` seconds it is analyzed
+    provisionally; those results are replaced on the next update and dropped
+    once the window closes, so nothing is counted twice.
+    """
+
+    def __init__(self, max_chars: int = 3500, overlap: int = 200, max_latency: float = 30.0):
+        self.chunker = IncrementalChunker(max_chars=max_chars, overlap=overlap)
+        self.max_latency = max_latency
+        self._summaries: List[str] = []
+        self._actions: List[ActionItem] = []
+        self._decisions: List[DecisionPoint] = []
+        self._provisional: Optional[tuple] = None
+        self._pending_since: Optional[float] = None
+        self._utterances = 0
+
+    def add_utterance(self, text: str) -> Optional[MeetingReport]:
+        """Feed one utterance; return a fresh snapshot if the report changed."""
+        text = text.strip()
+        if not text:
+            return self.poll()
+        separator = "\n" if self._utterances else ""
+        self._utterances += 1
+        closed = self.chunker.feed(separator + text)
+        if self._pending_since is None:
+            self._pending_since = time.monotonic()
+        if closed:
+            self._analyze(closed)
+            self._provisional = None
+            self._pending_since = time.monotonic() if self.chunker.pending() else None
+            return self.snapshot()
+        return self.poll()
+
+    def poll(self) -> Optional[MeetingReport]:
+        """Refresh the provisional tail if it has exceeded the latency bound."""
+        if self._pending_since is None:
+            return None
+        if time.monotonic() - self._pending_since < self.max_latency:
+            return None
+        tail = self.chunker.pending()
+        if tail is not None:
+            self._provisional = self._run([tail])
+        self._pending_since = None
+        return self.snapshot()
+
+    def snapshot(self) -> MeetingReport:
+        summaries, actions, decisions = self._summaries, self._actions, self._decisions
+        if self._provisional is not None:
+            extra_summaries, extra_actions, extra_decisions = self._provisional
+            summaries = summaries + extra_summaries
+            actions = actions + extra_actions
+            decisions = decisions + extra_decisions
+        return MeetingReport(
+            agenda_summary=" ".join(summaries),
+            # Overlapping windows (and a provisional tail) restate the same items
+            action_items=dedupe_action_items(actions),
+            decisions=list(decisions),
+            visuals=[],
+        )
+
+    def finish(self) -> MeetingReport:
+        """Close the final window and return the complete report."""
+        tail = self.chunker.flush()
+        if tail is not None:
+            self._analyze([tail])
+        self._provisional = None
+        self._pending_since = None
+        return self.snapshot()
+
+    def _analyze(self, chunks: List[TextChunk]) -> None:
+        summaries, actions, decisions = self._run(chunks)
+        self._summaries.extend(summaries)
+        self._actions.extend(actions)
+        self._decisions.extend(decisions)
+
+    @staticmethod
+    def _run(chunks: List[TextChunk]) -> tuple:
+        return (
+            summarize_chunks(chunks),
+            extract_actions_from_chunks(chunks),
+            extract_decisions_from_chunks(chunks),
+        )
+
+
+def tail_jsonl(
+    path: Path,
+    field: str = "source",
+    poll_interval: float = 1.0,
+    idle_timeout: Optional[float] = None,
+) -> Iterator[Optional[str]]:
+    """Follow a JSONL file that is still being written and yield utterance text.
+
+    Yields ``None`` after each idle poll so callers can honour latency bounds
+    while no new lines arrive. Stops after ``idle_timeout`` seconds without new
+    data, or runs until the consumer stops iterating when it is ``None``.
+    """
+    last_data = time.monotonic()
+    partial = ""
+    with path.open("r", encoding="utf-8") as fp:
+        while True:
+            line = fp.readline()
+            if line:
+                partial += line
+                if not partial.endswith("\n"):
+                    continue  # writer has not finished this row yet
+                row, partial = partial, ""
+                last_data = time.monotonic()
+                try:
+                    obj = json.loads(row)
+                except json.JSONDecodeError:
+                    continue
+                yield obj.get(field, "") if isinstance(obj, dict) else str(obj)
+                continue
+            if idle_timeout is not None and time.monotonic() - last_data >= idle_timeout:
+                return
+            yield None
+            time.sleep(poll_interval)
+
+
+def stream_meeting_reports(
+    utterances: Iterable[Optional[str]],
+    max_chars: int = 3500,
+    overlap: int = 200,
+    max_latency: float = 30.0,
+) -> Iterator[MeetingReport]:
+    """Yield partial report snapshots while consuming ``utterances``, then the final report."""
+    session = StreamingMeetingSession(max_chars=max_chars, overlap=overlap, max_latency=max_latency)
+    for utterance in utterances:
+        update = session.poll() if utterance is None else session.add_utterance(utterance)
+        if update is not None:
+            yield update
+    yield session.finish()
@@ -0,0 +1,268 @@
+"""Cross-meeting action-item tracking with MinHash/LSH near-duplicate detection."""
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .data_structures import ActionItem
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_WORD = re.compile(r"[a-z0-9]+")
+# Function words vary freely between restatements of the same task
+_FILLER = frozenset("a an the to of for on in at by with and or our we will should please".split())
+
+NUM_PERM = 128
+BANDS = 32  # 4 rows per band: pairs at Jaccard 0.5 collide in some band ~87% of the time
+
+
+def _normalize(text: str) -> str:
+    return " ".join(word for word in _WORD.findall(text.lower()) if word not in _FILLER)
+
+
+def _numbers(text: str) -> frozenset:
+    # "Q3" vs "Q4" or "item 12" vs "item 13" differ in one short token but are distinct tasks
+    return frozenset(word for word in _WORD.findall(text.lower()) if any(c.isdigit() for c in word))
+
+
+def _shingles(text: str, size: int = 4) -> List[int]:
+    """Character ``size``-grams hashed with crc32 (stable across processes)."""
+    norm = _normalize(text)
+    if len(norm) <= size:
+        return [zlib.crc32(norm.encode("utf-8"))] if norm else []
+    return list({zlib.crc32(norm[i : i + size].encode("utf-8")) for i in range(len(norm) - size + 1)})
+
+
+class MinHasher:
+    """Fixed family of ``num_perm`` universal hash functions for MinHash signatures."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1) -> None:
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        hashes = np.array(_shingles(text), dtype=np.uint64)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (a*x + b) mod p, truncated to 32 bits; uint64 wrap-around is part of the family
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+
+def estimated_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+
+class LshIndex:
+    """Banded LSH over MinHash signatures; lookups cost O(bands), not O(items)."""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def _keys(self, signature: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows : (band + 1) * self.rows].tobytes()
+
+    def insert(self, key: int, signature: np.ndarray) -> None:
+        for bucket in self._keys(signature):
+            self._buckets.setdefault(bucket, []).append(key)
+
+    def candidates(self, signature: np.ndarray) -> List[int]:
+        found = set()
+        for bucket in self._keys(signature):
+            found.update(self._buckets.get(bucket, ()))
+        return sorted(found)
+
+
+@dataclass
+class TrackedAction:
+    """One action item followed across a meeting series."""
+
+    id: int
+    description: str
+    owner: str
+    deadline: str
+    support: str
+    first_seen: str
+    last_seen: str
+    meetings: List[str] = field(default_factory=list)
+    owner_changes: List[Dict[str, str]] = field(default_factory=list)
+    deadline_changes: List[Dict[str, str]] = field(default_factory=list)
+
+    @property
+    def deadline_slips(self) -> int:
+        return len(self.deadline_changes)
+
+
+class ActionTracker:
+    """Persistent registry linking restated action items across meetings.
+
+    Each incoming item is matched against earlier items through LSH buckets and
+    confirmed when the estimated Jaccard similarity of its character shingles
+    reaches ``threshold`` and both mention the same numbers. Matches update ``last_seen`` and record owner and
+    deadline changes; everything else becomes a new tracked item.
+    """
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = NUM_PERM, bands: int = BANDS) -> None:
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm=num_perm)
+        self.index = LshIndex(num_perm=num_perm, bands=bands)
+        self.items: List[TrackedAction] = []
+        self._signatures: List[np.ndarray] = []
+
+    def match(self, item: ActionItem) -> Optional[TrackedAction]:
+        found = self._best_match(item.description, self.hasher.signature(item.description))
+        return self.items[found] if found is not None else None
+
+    def update(self, meeting_id: str, actions: Iterable[ActionItem]) -> List[TrackedAction]:
+        """Fold one meeting's action items into the tracker; returns the touched items."""
+        touched: List[TrackedAction] = []
+        for action in actions:
+            if not action.description.strip():
+                continue
+            signature = self.hasher.signature(action.description)
+            found = self._best_match(action.description, signature)
+            if found is None:
+                touched.append(self._add(meeting_id, action, signature))
+                continue
+            tracked = self.items[found]
+            if meeting_id not in tracked.meetings:
+                tracked.meetings.append(meeting_id)
+            tracked.last_seen = meeting_id
+            if action.owner and action.owner != tracked.owner:
+                tracked.owner_changes.append(
+                    {"meeting": meeting_id, "from": tracked.owner, "to": action.owner}
+                )
+                tracked.owner = action.owner
+            if action.deadline and action.deadline != tracked.deadline:
+                tracked.deadline_changes.append(
+                    {"meeting": meeting_id, "from": tracked.deadline, "to": action.deadline}
+                )
+                tracked.deadline = action.deadline
+            touched.append(tracked)
+        return touched
+
+    def save(self, path: Path) -> None:
+        payload = {
+            "threshold": self.threshold,
+            "num_perm": self.hasher.num_perm,
+            "bands": self.index.bands,
+            "items": [asdict(item) for item in self.items],
+            "signatures": [sig.tolist() for sig in self._signatures],
+        }
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ActionTracker":
+        """Load a saved tracker, or start an empty one if ``path`` does not exist yet."""
+        if not path.exists():
+            return cls()
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        tracker = cls(
+            threshold=payload.get("threshold", 0.5),
+            num_perm=payload.get("num_perm", NUM_PERM),
+            bands=payload.get("bands", BANDS),
+        )
+        for item, signature in zip(payload.get("items", []), payload.get("signatures", [])):
+            tracked = TrackedAction(**item)
+            sig = np.array(signature, dtype=np.uint64)
+            tracker.items.append(tracked)
+            tracker._signatures.append(sig)
+            tracker.index.insert(tracked.id, sig)
+        return tracker
+
+    def _best_match(self, description: str, signature: np.ndarray) -> Optional[int]:
+        best, best_score = None, self.threshold
+        numbers = _numbers(description)
+        for key in self.index.candidates(signature):
+            if _numbers(self.items[key].description) != numbers:
+                continue
+            score = estimated_jaccard(signature, self._signatures[key])
+            if score >= best_score:
+                best, best_score = key, score
+        return best
+
+    def _add(self, meeting_id: str, action: ActionItem, signature: np.ndarray) -> TrackedAction:
+        tracked = TrackedAction(
+            id=len(self.items),
+            description=action.description,
+            owner=action.owner,
+            deadline=action.deadline,
+            support=action.support,
+            first_seen=meeting_id,
+            last_seen=meeting_id,
+            meetings=[meeting_id],
+        )
+        self.items.append(tracked)
+        self._signatures.append(signature)
+        self.index.insert(tracked.id, signature)
+        return tracked
+
+
+# Overlapping chunks repeat an item almost verbatim; restatements across meetings vary more
+DEDUPE_THRESHOLD = 0.8
+
+
+def _compatible(a: str, b: str) -> bool:
+    return not a or not b or a.strip().lower() == b.strip().lower()
+
+
+def dedupe_action_items(
+    items: List[ActionItem], threshold: float = DEDUPE_THRESHOLD
+) -> List[ActionItem]:
+    """Collapse near-duplicate items (e.g. from overlapping chunks) within one report.
+
+    Two items merge only when their descriptions are near-identical, mention the
+    same numbers, and their owners and deadlines agree or one side is blank. The
+    first occurrence is kept and its blank fields are filled from the duplicate.
+    Items with blank descriptions are passed through untouched.
+    """
+    hasher = MinHasher()
+    index = LshIndex()
+    kept: List[ActionItem] = []
+    signatures: Dict[int, np.ndarray] = {}
+    for item in items:
+        copy = ActionItem(
+            description=item.description,
+            owner=item.owner,
+            deadline=item.deadline,
+            support=item.support,
+        )
+        if not _normalize(item.description):
+            kept.append(copy)
+            continue
+        signature = hasher.signature(item.description)
+        duplicate = None
+        for key in index.candidates(signature):
+            other = kept[key]
+            if (
+                estimated_jaccard(signature, signatures[key]) >= threshold
+                and _numbers(item.description) == _numbers(other.description)
+                and _compatible(item.owner, other.owner)
+                and _compatible(item.deadline, other.deadline)
+            ):
+                duplicate = other
+                break
+        if duplicate is None:
+            signatures[len(kept)] = signature
+            index.insert(len(kept), signature)
+            kept.append(copy)
+            continue
+        duplicate.owner = duplicate.owner or item.owner
+        duplicate.deadline = duplicate.deadline or item.deadline
+        duplicate.support = duplicate.support or item.support
+    return kept
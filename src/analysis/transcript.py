@@ -3,16 +3,18 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Iterable, List
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Iterable, Iterator, List, Union
 
-from ..utils.model_registry import (
-    get_action_generator,
-    get_decision_generator,
-    get_summarizer,
-)
-from ..utils.text import chunk_text
+from ..utils.budgets import generation_budget, record_generated
+from ..utils.model_registry import get_batcher
+from ..utils.text import ChunkView, TextChunk, TextSource, iter_chunks
 from .data_structures import ActionItem, DecisionPoint
 
+# Stages accept materialized chunks or lazy views; text is sliced on consumption
+Chunk = Union[TextChunk, ChunkView]
+
 ACTION_PROMPT = (
     "You are an expert meeting assistant. From this transcript chunk, extract actionable tasks.\n"
     "Return a JSON list where each entry has 'action', 'owner', 'deadline', 'support'."
@@ -38,46 +40,85 @@ def _safe_json_parse(text: str):
         return []
 
 
-def summarize_transcript(transcript: str) -> str:
-    summarizer = get_summarizer()
-    chunks = chunk_text(transcript)
-    if not chunks:
-        return ""
-    pieces = []
+def _parse_actions(text: str) -> List[ActionItem]:
+    return [
+        ActionItem(
+            description=obj.get("action", ""),
+            owner=obj.get("owner", ""),
+            deadline=obj.get("deadline", ""),
+            support=obj.get("support", ""),
+        )
+        for obj in _safe_json_parse(text)
+    ]
+
+
+def _parse_decisions(text: str) -> List[DecisionPoint]:
+    return [
+        DecisionPoint(summary=obj.get("decision", ""), support=obj.get("support", ""))
+        for obj in _safe_json_parse(text)
+    ]
+
+
+# Requests kept in flight per stage, in batches: enough to keep the batcher
+# full without slicing every chunk's text and queueing it up front
+INFLIGHT_BATCHES = 4
+
+
+def _generated(alias: str, future: Future, key: str) -> str:
+    """Output text of one request, counted against the alias' generation budget."""
+    text = future.result()[0][key]
+    record_generated(alias, text)
+    return text
+
+
+def _generate(alias: str, chunks: Iterable[Chunk], key: str, prompt: str = "") -> Iterator[str]:
+    """Yield the alias' output for each chunk, in order, with bounded submissions in flight."""
+    batcher = get_batcher(alias)
+    limit = INFLIGHT_BATCHES * batcher.max_batch_size
+    pending: Deque[Future] = deque()
     for chunk in chunks:
-        summary = summarizer(chunk.content)[0]["summary_text"]
-        pieces.append(summary.strip())
-    return " ".join(pieces)
-
-
-def extract_action_items(transcript: str) -> List[ActionItem]:
-    generator = get_action_generator()
-    items: List[ActionItem] = []
-    for chunk in chunk_text(transcript):
-        prompt = f"{ACTION_PROMPT}\nTranscript:\n{chunk.content}"
-        result = generator(prompt)[0]["generated_text"]
-        payload = _safe_json_parse(result)
-        for obj in payload:
-            items.append(
-                ActionItem(
-                    description=obj.get("action", ""),
-                    owner=obj.get("owner", ""),
-                    deadline=obj.get("deadline", ""),
-                    support=obj.get("support", ""),
-                )
-            )
-    return items
-
-
-def extract_decisions(transcript: str) -> List[DecisionPoint]:
-    generator = get_decision_generator()
-    decisions: List[DecisionPoint] = []
-    for chunk in chunk_text(transcript):
-        prompt = f"{DECISION_PROMPT}\nTranscript:\n{chunk.content}"
-        result = generator(prompt)[0]["generated_text"]
-        payload = _safe_json_parse(result)
-        for obj in payload:
-            decisions.append(
-                DecisionPoint(summary=obj.get("decision", ""), support=obj.get("support", ""))
-            )
-    return decisions
+        text = chunk.content
+        # Similar-length chunks get the same bucketed budget and so batch together
+        payload = f"{prompt}\nTranscript:\n{text}" if prompt else text
+        pending.append(batcher.submit(payload, **generation_budget(alias, text)))
+        if len(pending) >= limit:
+            yield _generated(alias, pending.popleft(), key)
+    while pending:
+        yield _generated(alias, pending.popleft(), key)
+
+
+def summarize_chunks(chunks: Iterable[Chunk]) -> List[str]:
+    """Summarize each chunk; several batches are kept queued so chunks batch together."""
+    return [summary.strip() for summary in _generate("summarizer", chunks, "summary_text")]
+
+
+def extract_actions_per_chunk(chunks: Iterable[Chunk]) -> List[List[ActionItem]]:
+    """Model-tier action items, one list per input chunk."""
+    outputs = _generate("action_generator", chunks, "generated_text", ACTION_PROMPT)
+    return [_parse_actions(text) for text in outputs]
+
+
+def extract_decisions_per_chunk(chunks: Iterable[Chunk]) -> List[List[DecisionPoint]]:
+    """Model-tier decisions, one list per input chunk."""
+    outputs = _generate("decision_generator", chunks, "generated_text", DECISION_PROMPT)
+    return [_parse_decisions(text) for text in outputs]
+
+
+def extract_actions_from_chunks(chunks: Iterable[Chunk]) -> List[ActionItem]:
+    return [item for items in extract_actions_per_chunk(chunks) for item in items]
+
+
+def extract_decisions_from_chunks(chunks: Iterable[Chunk]) -> List[DecisionPoint]:
+    return [item for items in extract_decisions_per_chunk(chunks) for item in items]
+
+
+def summarize_transcript(transcript: TextSource) -> str:
+    return " ".join(summarize_chunks(iter_chunks(transcript)))
+
+
+def extract_action_items(transcript: TextSource) -> List[ActionItem]:
+    return extract_actions_from_chunks(iter_chunks(transcript))
+
+
+def extract_decisions(transcript: TextSource) -> List[DecisionPoint]:
+    return extract_decisions_from_chunks(iter_chunks(transcript))
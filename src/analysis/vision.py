@@ -1,10 +1,13 @@
 """Vision utilities for extracting cues from meeting screenshots."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, List
 
-from ..utils.model_registry import get_captioner
+from PIL import Image
+
+from ..utils.model_registry import get_batcher
 from .data_structures import VisualInsight
 
 
@@ -12,6 +15,29 @@ CAPTION_PROMPT = (
     "Caption the meeting slide or whiteboard and include any visible action cues or deadlines."
 )
 
+# BLIP base resizes every input to 384x384, so decoding beyond that is wasted work
+CAPTION_INPUT_SIDE = 384
+# Images above these limits are rejected before any pixel data is decoded
+MAX_IMAGE_PIXELS = 50_000_000
+MAX_IMAGE_BYTES = 64 * 1024 * 1024
+PREPROCESS_WORKERS = 4
+
+# EXIF orientation tag -> transpose that restores the upright image
+_EXIF_ORIENTATION = 0x0112
+_ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+class ImageRejected(ValueError):
+    """Raised when an image is too large to decode within the per-image budget."""
+
 
 def _iter_images(image_dir: Path) -> Iterable[Path]:
     patterns = ["*.png", "*.jpg", "*.jpeg", "*.webp"]
@@ -20,16 +46,59 @@ def _iter_images(image_dir: Path) -> Iterable[Path]:
             yield path
 
 
-def analyze_images(image_dir: Path) -> List[VisualInsight]:
-    captioner = get_captioner()
+def preprocess_image(path: Path, target_side: int = CAPTION_INPUT_SIDE) -> Image.Image:
+    """Decode, upright and downsize one image for the captioner.
+
+    Only the header is read before the size checks. JPEGs are decoded at a
+    reduced DCT scale, so their decode memory is bounded by the target size
+    rather than the upload size. The result is scaled so its shorter side is
+    ``target_side`` (never upscaled), which is all the captioner will use.
+    """
+    if path.stat().st_size > MAX_IMAGE_BYTES:
+        limit_mib = MAX_IMAGE_BYTES // (1024 * 1024)
+        raise ImageRejected(f"{path.name}: file larger than {limit_mib} MiB")
+    with Image.open(path) as img:
+        width, height = img.size
+        if width * height > MAX_IMAGE_PIXELS:
+            raise ImageRejected(f"{path.name}: {width}x{height} exceeds {MAX_IMAGE_PIXELS} pixels")
+        orientation = img.getexif().get(_EXIF_ORIENTATION, 1)
+        scale = max(target_side / width, target_side / height)
+        if scale < 1:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            img.draft("RGB", size)  # JPEG only; a no-op for other formats
+            # reducing_gap lets Pillow shrink by integer factors before resampling
+            out = img.convert("RGB").resize(size, Image.Resampling.BICUBIC, reducing_gap=2.0)
+        else:
+            out = img.convert("RGB")
+    transpose = _ORIENTATION_TRANSPOSE.get(orientation)
+    return out.transpose(transpose) if transpose is not None else out
+
+
+def analyze_images(image_dir: Path, workers: int = PREPROCESS_WORKERS) -> List[VisualInsight]:
+    captioner = get_batcher("captioner")
+    paths = list(_iter_images(image_dir))
+    if not paths:
+        return []
     visuals: List[VisualInsight] = []
-    for image_path in _iter_images(image_dir):
-        result = captioner(str(image_path), prompt=CAPTION_PROMPT)
-        caption = result[0]["generated_text"].strip()
+    # Pillow releases the GIL while decoding/resizing, so a thread pool overlaps
+    # preprocessing of later images with captioning of earlier ones
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as pool:
+        prepared = [pool.submit(preprocess_image, path) for path in paths]
+        captions = []
+        for prep in prepared:
+            try:
+                captions.append(captioner.submit(prep.result(), prompt=CAPTION_PROMPT))
+            except (ImageRejected, Image.DecompressionBombError, OSError) as exc:
+                captions.append(exc)
+    for image_path, caption in zip(paths, captions):
+        if isinstance(caption, Exception):
+            text = f"Image skipped: {caption}"
+        else:
+            text = caption.result()[0]["generated_text"].strip()
         visuals.append(
             VisualInsight(
                 image_path=str(image_path.resolve()),
-                caption=caption,
+                caption=text,
                 linked_topics=[],
             )
         )
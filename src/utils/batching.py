@@ -0,0 +1,198 @@
+"""Dynamic micro-batching in front of the shared Hugging Face pipelines."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class BatchStats:
+    """Snapshot of scheduler activity for a single model alias."""
+
+    name: str
+    queue_depth: int
+    max_queue_depth: int
+    batches: int
+    items: int
+    max_batch_size: int
+    batch_size_histogram: Dict[int, int] = field(default_factory=dict)
+    mean_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "batches": self.batches,
+            "items": self.items,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": round(self.mean_batch_size, 3),
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "mean_wait_ms": round(self.mean_wait_ms, 3),
+            "max_wait_ms": round(self.max_wait_ms, 3),
+        }
+
+
+@dataclass
+class _Request:
+    payload: Any
+    key: Tuple[Tuple[str, Any], ...]
+    kwargs: Dict[str, Any]
+    future: Future
+    enqueued: float
+
+
+class MicroBatcher:
+    """Collect single-item requests from many threads and run them as batches.
+
+    A batch is dispatched once ``max_batch_size`` compatible requests are queued
+    or the oldest request has waited ``max_wait_ms``. Requests are compatible
+    when they were submitted with the same keyword arguments, so per-call
+    generation settings never leak across callers.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        name: str = "pipeline",
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+    ) -> None:
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms cannot be negative")
+        self.fn = fn
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._queue: Deque[_Request] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+        self._max_depth = 0
+        self._batches = 0
+        self._items = 0
+        self._histogram: Dict[int, int] = {}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, payload: Any, **kwargs: Any) -> Future:
+        """Queue one input and return a future resolving to ``fn(payload)``'s output."""
+        future: Future = Future()
+        key = tuple(sorted(kwargs.items()))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"Batcher '{self.name}' is closed")
+            self._ensure_worker()
+            self._queue.append(_Request(payload, key, kwargs, future, time.perf_counter()))
+            self._max_depth = max(self._max_depth, len(self._queue))
+            self._cond.notify()
+        return future
+
+    def map(self, payloads: Iterable[Any], **kwargs: Any) -> List[Any]:
+        """Submit several inputs at once and wait for all of their results."""
+        futures = [self.submit(payload, **kwargs) for payload in payloads]
+        return [future.result() for future in futures]
+
+    def __call__(self, payload: Any, **kwargs: Any) -> Any:
+        return self.submit(payload, **kwargs).result()
+
+    def stats(self) -> BatchStats:
+        with self._cond:
+            return BatchStats(
+                name=self.name,
+                queue_depth=len(self._queue),
+                max_queue_depth=self._max_depth,
+                batches=self._batches,
+                items=self._items,
+                max_batch_size=self.max_batch_size,
+                batch_size_histogram=dict(self._histogram),
+                mean_wait_ms=(self._wait_total / self._items * 1000.0) if self._items else 0.0,
+                max_wait_ms=self._wait_max * 1000.0,
+            )
+
+    def close(self) -> None:
+        """Stop accepting work; queued requests are still drained."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name=f"batcher-{self.name}", daemon=True
+            )
+            self._worker.start()
+
+    def _next_batch(self) -> List[_Request]:
+        with self._cond:
+            while not self._queue:
+                if self._closed:
+                    return []
+                self._cond.wait()
+
+            head = self._queue[0]
+            deadline = head.enqueued + self.max_wait
+            while not self._closed:
+                ready = sum(1 for req in self._queue if req.key == head.key)
+                remaining = deadline - time.perf_counter()
+                if ready >= self.max_batch_size or remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+
+            batch: List[_Request] = []
+            kept: Deque[_Request] = deque()
+            for req in self._queue:
+                if req.key == head.key and len(batch) < self.max_batch_size:
+                    batch.append(req)
+                else:
+                    kept.append(req)
+            self._queue = kept
+
+            now = time.perf_counter()
+            self._batches += 1
+            self._items += len(batch)
+            self._histogram[len(batch)] = self._histogram.get(len(batch), 0) + 1
+            for req in batch:
+                waited = now - req.enqueued
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                return
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[_Request]) -> None:
+        payloads = [req.payload for req in batch]
+        try:
+            outputs = list(self.fn(payloads, batch_size=len(payloads), **batch[0].kwargs))
+            if len(outputs) != len(payloads):
+                raise RuntimeError(
+                    f"Batcher '{self.name}' got {len(outputs)} outputs for {len(payloads)} inputs"
+                )
+        except Exception as exc:  # surface the failure to every waiting caller
+            for req in batch:
+                req.future.set_exception(exc)
+            return
+        for req, output in zip(batch, outputs):
+            # Pipelines return a bare dict per item for list inputs; wrap it so
+            # callers see the same shape as a single-input call.
+            req.future.set_result([output] if isinstance(output, dict) else output)
@@ -0,0 +1,165 @@
+"""Per-chunk generation budgets derived from input length and pipeline stage."""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .model_registry import GENERATION_BUDGETS, MODEL_REGISTRY, get_pipeline
+
+# Budgets snap to these values so chunks of similar length share batcher kwargs
+BUDGET_BUCKETS = (8, 16, 24, 32, 48, 64, 96, 128, 160, 192, 256, 384, 512)
+
+_ADAPTIVE = True
+
+
+def set_adaptive_budgets(enabled: bool) -> None:
+    """Toggle adaptive budgets; when off every chunk gets the registry's fixed kwargs."""
+    global _ADAPTIVE
+    _ADAPTIVE = enabled
+
+
+@dataclass
+class BudgetStats:
+    """Decode-step accounting per alias, against the registry's fixed limits.
+
+    ``max_steps_saved`` is how much the per-chunk ceiling dropped (an upper bound
+    on saved decode steps); ``forced_steps_saved`` counts ``min_length`` steps
+    that short chunks no longer have to generate. ``generated_tokens`` is what
+    the model actually produced, re-encoded with the alias' tokenizer, to set
+    against ``budget_max_steps``.
+    """
+
+    requests: int = 0
+    input_tokens: int = 0
+    default_max_steps: int = 0
+    budget_max_steps: int = 0
+    default_min_steps: int = 0
+    budget_min_steps: int = 0
+    generated_tokens: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "input_tokens": self.input_tokens,
+            "default_max_steps": self.default_max_steps,
+            "budget_max_steps": self.budget_max_steps,
+            "max_steps_saved": self.default_max_steps - self.budget_max_steps,
+            "forced_steps_saved": self.default_min_steps - self.budget_min_steps,
+            "generated_tokens": self.generated_tokens,
+        }
+
+
+_STATS: Dict[str, BudgetStats] = {}
+_STATS_LOCK = threading.Lock()
+
+# alias -> (pipeline tokenizer, private counting copy, lock serializing that copy)
+_COUNTERS: Dict[str, Tuple[Any, Any, threading.Lock]] = {}
+# Guards _COUNTERS only; never held while a pipeline or tokenizer loads or encodes
+_COUNTERS_LOCK = threading.Lock()
+
+
+def _counting_tokenizer(alias: str) -> Optional[Tuple[Any, threading.Lock]]:
+    """A separate tokenizer instance for counting in caller threads, with its lock.
+
+    The pipeline's fast tokenizer flips its truncation state while the dispatch
+    thread encodes a batch; touching it from another thread at the same time
+    fails with "Already borrowed". The copy is loaded from the same files and
+    rebuilt when the registry swaps the pipeline. Loading happens outside any
+    lock, so one alias' slow load never stalls counting for another alias.
+    """
+    tokenizer = getattr(get_pipeline(alias), "tokenizer", None)
+    if tokenizer is None:
+        return None
+    cached = _COUNTERS.get(alias)
+    if cached is None or cached[0] is not tokenizer:
+        copy = type(tokenizer).from_pretrained(tokenizer.name_or_path)
+        with _COUNTERS_LOCK:
+            cached = _COUNTERS.get(alias)
+            # A racing caller may have installed its copy first; keep that one
+            if cached is None or cached[0] is not tokenizer:
+                cached = (tokenizer, copy, threading.Lock())
+                _COUNTERS[alias] = cached
+    return cached[1], cached[2]
+
+
+def count_tokens(alias: str, text: str) -> int:
+    """Length of ``text`` in the alias' own tokens (~4 characters each without a tokenizer)."""
+    counter = _counting_tokenizer(alias)
+    if counter is None:
+        return max(1, len(text) // 4)
+    tokenizer, lock = counter
+    with lock:
+        # verbose=False: chunks may exceed the model's max length; the pipeline truncates
+        return len(tokenizer(text, add_special_tokens=False, verbose=False)["input_ids"])
+
+
+def _bucket_up(value: float, cap: int) -> int:
+    for bucket in BUDGET_BUCKETS:
+        if bucket >= value:
+            return min(bucket, cap)
+    return cap
+
+
+def _bucket_down(value: float) -> int:
+    return max([bucket for bucket in BUDGET_BUCKETS if bucket <= value] or [0])
+
+
+def generation_budget(alias: str, text: str) -> Dict[str, int]:
+    """Generation kwargs for one input of ``alias``, to pass through ``MicroBatcher.submit``.
+
+    Aliases without a budget rule (e.g. the captioner) get ``{}`` and keep their
+    registry kwargs.
+    """
+    rule = GENERATION_BUDGETS.get(alias)
+    if rule is None:
+        return {}
+    defaults = MODEL_REGISTRY[alias].get("kwargs", {})
+    tokens = count_tokens(alias, text)
+    target = max(rule["floor"], tokens * rule["ratio"])
+    if "max_new_tokens" in defaults:
+        cap = defaults["max_new_tokens"]
+        budget = {"max_new_tokens": _bucket_up(target, cap) if _ADAPTIVE else cap}
+        _record(alias, tokens, cap, budget["max_new_tokens"], 0, 0)
+        return budget
+    cap = defaults["max_length"]
+    default_min = defaults.get("min_length", 0)
+    max_length = _bucket_up(target, cap) if _ADAPTIVE else cap
+    min_length = default_min
+    if _ADAPTIVE:
+        min_length = min(default_min, _bucket_down(tokens * rule.get("min_ratio", 0.0)))
+        min_length = min(min_length, max_length // 2)
+    _record(alias, tokens, cap, max_length, default_min, min_length)
+    return {"max_length": max_length, "min_length": min_length}
+
+
+def _record(
+    alias: str, tokens: int, default_max: int, budget_max: int, default_min: int, budget_min: int
+) -> None:
+    with _STATS_LOCK:
+        stats = _STATS.setdefault(alias, BudgetStats())
+        stats.requests += 1
+        stats.input_tokens += tokens
+        stats.default_max_steps += default_max
+        stats.budget_max_steps += budget_max
+        stats.default_min_steps += default_min
+        stats.budget_min_steps += budget_min
+
+
+def record_generated(alias: str, text: str) -> None:
+    """Add the token length of one generated output to the alias' stats."""
+    if alias not in GENERATION_BUDGETS:
+        return
+    tokens = count_tokens(alias, text)
+    with _STATS_LOCK:
+        _STATS.setdefault(alias, BudgetStats()).generated_tokens += tokens
+
+
+def budget_stats() -> Dict[str, BudgetStats]:
+    with _STATS_LOCK:
+        return {alias: BudgetStats(**vars(stats)) for alias, stats in _STATS.items()}
+
+
+def reset_budget_stats() -> None:
+    with _STATS_LOCK:
+        _STATS.clear()
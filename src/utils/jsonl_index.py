@@ -0,0 +1,183 @@
+"""Sidecar byte-offset index for random access into large JSONL corpora."""
+from __future__ import annotations
+
+import bz2
+import gzip
+import json
+import lzma
+import mmap
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Dict, List, Optional
+
+INDEX_SUFFIX = ".idx.json"
+INDEX_VERSION = 1
+# Compressed exports written by scripts/download_data.py --compression
+_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def is_jsonl(path: Path) -> bool:
+    """True for ``.jsonl`` files, including ``.jsonl.gz``/``.bz2``/``.xz`` exports."""
+    if path.suffix in _OPENERS:
+        path = path.with_suffix("")
+    return path.suffix == ".jsonl"
+
+
+def open_jsonl(path: Path) -> IO[str]:
+    """Open a plain or compressed JSONL file for streaming text reads."""
+    opener = _OPENERS.get(path.suffix)
+    if opener is None:
+        return path.open("r", encoding="utf-8")
+    return opener(path, "rt", encoding="utf-8")
+
+
+@dataclass
+class JsonlIndex:
+    """Line start offsets plus a meeting id -> line numbers map for one JSONL file."""
+
+    size: int
+    mtime_ns: int
+    id_field: str
+    offsets: array = field(default_factory=lambda: array("Q"))
+    ids: Dict[str, List[int]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def is_current(self, path: Path) -> bool:
+        stat = path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def save(self, target: Path) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "id_field": self.id_field,
+            "offsets": self.offsets.tolist(),
+            "ids": self.ids,
+        }
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(target)
+
+    @classmethod
+    def load(cls, target: Path) -> Optional["JsonlIndex"]:
+        try:
+            payload = json.loads(target.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if payload.get("version") != INDEX_VERSION:
+            return None
+        return cls(
+            size=payload["size"],
+            mtime_ns=payload["mtime_ns"],
+            id_field=payload["id_field"],
+            offsets=array("Q", payload["offsets"]),
+            ids=payload["ids"],
+        )
+
+
+def build_index(path: Path, id_field: str = "meeting_id") -> JsonlIndex:
+    """Index ``path`` in a single streaming pass over its lines."""
+    stat = path.stat()
+    index = JsonlIndex(size=stat.st_size, mtime_ns=stat.st_mtime_ns, id_field=id_field)
+    offset = 0
+    with path.open("rb") as fp:
+        for line_no, raw in enumerate(fp):
+            index.offsets.append(offset)
+            offset += len(raw)
+            try:
+                obj = json.loads(raw)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict) and obj.get(id_field) is not None:
+                index.ids.setdefault(str(obj[id_field]), []).append(line_no)
+    return index
+
+
+def load_or_build_index(path: Path, id_field: str = "meeting_id") -> JsonlIndex:
+    """Reuse the sidecar index when it still matches ``path``; rebuild it otherwise."""
+    if not path.exists():
+        raise FileNotFoundError(path)
+    if path.suffix in _OPENERS:
+        # Byte offsets into a compressed stream cannot be seeked to or memory-mapped
+        raise ValueError(f"Indexed access needs an uncompressed .jsonl file: {path}")
+    sidecar = index_path_for(path)
+    index = JsonlIndex.load(sidecar) if sidecar.exists() else None
+    if index is not None and index.id_field == id_field and index.is_current(path):
+        return index
+    index = build_index(path, id_field=id_field)
+    try:
+        index.save(sidecar)
+    except OSError:
+        pass  # read-only location; keep the in-memory index
+    return index
+
+
+class JsonlReader:
+    """Memory-mapped reader that seeks straight to indexed JSONL records."""
+
+    def __init__(self, path: Path, id_field: str = "meeting_id") -> None:
+        self.path = path
+        self.id_field = id_field
+        self._fp = None
+        self._map: Optional[mmap.mmap] = None
+        self.index = load_or_build_index(path, id_field=id_field)
+        self._open()
+
+    def __enter__(self) -> "JsonlReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self._ensure_current()
+        return len(self.index)
+
+    def line(self, line_no: int) -> dict:
+        """Return the parsed record on ``line_no`` (zero-based)."""
+        self._ensure_current()
+        if not 0 <= line_no < len(self.index):
+            raise IndexError(f"Line {line_no} out of range for {self.path}")
+        start = self.index.offsets[line_no]
+        end = (
+            self.index.offsets[line_no + 1]
+            if line_no + 1 < len(self.index)
+            else self.index.size
+        )
+        return json.loads(self._map[start:end])
+
+    def meeting(self, meeting_id: str) -> List[dict]:
+        """Return every record for ``meeting_id`` in file order."""
+        self._ensure_current()
+        if meeting_id not in self.index.ids:
+            raise KeyError(f"Unknown meeting id: {meeting_id}")
+        return [self.line(line_no) for line_no in self.index.ids[meeting_id]]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def _open(self) -> None:
+        self._fp = self.path.open("rb")
+        # mmap cannot map an empty file; an empty index never dereferences it
+        if self.index.size:
+            self._map = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _ensure_current(self) -> None:
+        if self.index.is_current(self.path):
+            return
+        self.close()
+        self.index = load_or_build_index(self.path, id_field=self.id_field)
+        self._open()
@@ -1,10 +1,13 @@
 """Lazy-loaded Hugging Face pipelines used across the project."""
 from __future__ import annotations
 
+import os
+import threading
 from functools import lru_cache
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
-from transformers import pipeline
+from .batching import BatchStats, MicroBatcher
+from .resources import get_resource_manager
 
 # Model catalog keeps the primary models in one place so we can swap if needed
 MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
@@ -32,11 +35,75 @@ MODEL_REGISTRY: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Per-chunk generation budgets (see budgets.py): output length scales with input
+# tokens by ``ratio``, never below ``floor``; the registry kwargs above are the caps.
+# ``min_ratio`` scales the summarizer's forced minimum the same way.
+GENERATION_BUDGETS: Dict[str, Dict[str, float]] = {
+    "summarizer": {"ratio": 0.5, "floor": 24, "min_ratio": 0.125},
+    "action_generator": {"ratio": 0.5, "floor": 32},
+    "decision_generator": {"ratio": 0.4, "floor": 24},
+}
+
+
+# Passed to from_pretrained for every alias: low_cpu_mem_usage skips the random-init
+# pass and loads safetensors shards straight into the final tensors, so weights are
+# written once and stay shareable with forked workers (see prewarm.py)
+MODEL_LOAD_KWARGS: Dict[str, Any] = {"low_cpu_mem_usage": True}
+
+
+# Micro-batching limits per alias; concurrent callers share one queue per model
+BATCHING: Dict[str, Dict[str, Any]] = {
+    "summarizer": {"max_batch_size": 4, "max_wait_ms": 15.0},
+    "action_generator": {"max_batch_size": 8, "max_wait_ms": 10.0},
+    "decision_generator": {"max_batch_size": 8, "max_wait_ms": 10.0},
+    "captioner": {"max_batch_size": 8, "max_wait_ms": 10.0},
+}
+
+
+# Optional replacement for Hugging Face pipeline construction (stub backends, tests)
+PipelineFactory = Callable[[str, Dict[str, Any]], Any]
+_PIPELINE_FACTORY: Optional[PipelineFactory] = None
+
+
+def set_pipeline_factory(factory: Optional[PipelineFactory]) -> None:
+    """Build every alias with ``factory(name, info)`` instead of ``transformers.pipeline``.
+
+    Pass ``None`` to restore the Hugging Face backend. Cached pipelines and
+    batchers are dropped so the next call picks up the new backend.
+    """
+    global _PIPELINE_FACTORY
+    _PIPELINE_FACTORY = factory
+    reset_pipelines()
+
+
+def reset_pipelines() -> None:
+    """Forget cached pipelines and shut down their batchers."""
+    with _BATCHERS_LOCK:
+        batchers = list(_BATCHERS.values())
+        _BATCHERS.clear()
+    for batcher in batchers:
+        batcher.close()
+    for getter in _GETTERS.values():
+        getter.cache_clear()
+
+
 def _build_pipeline(name: str):
     if name not in MODEL_REGISTRY:
         raise KeyError(f"Unknown model alias: {name}")
     info = MODEL_REGISTRY[name]
-    return pipeline(task=info["task"], model=info["model"], **info.get("kwargs", {}))
+    if _PIPELINE_FACTORY is not None:
+        return _PIPELINE_FACTORY(name, info)
+    # Imported lazily so stub backends run without transformers installed
+    from transformers import pipeline
+
+    # Fix torch's inter-op pool before any model runs; later calls are no-ops
+    get_resource_manager().configure_process()
+    return pipeline(
+        task=info["task"],
+        model=info["model"],
+        model_kwargs={**MODEL_LOAD_KWARGS, **info.get("model_kwargs", {})},
+        **info.get("kwargs", {}),
+    )
 
 
 @lru_cache(maxsize=None)
@@ -61,3 +128,63 @@ def get_decision_generator():
 def get_captioner():
     """Return a cached BLIP captioning pipeline."""
     return _build_pipeline("captioner")
+
+
+_GETTERS: Dict[str, Callable[[], Any]] = {
+    "summarizer": get_summarizer,
+    "action_generator": get_action_generator,
+    "decision_generator": get_decision_generator,
+    "captioner": get_captioner,
+}
+
+def get_pipeline(name: str) -> Any:
+    """Return the cached pipeline for a registry alias, loading it on first use."""
+    if name not in _GETTERS:
+        raise KeyError(f"Unknown model alias: {name}")
+    return _GETTERS[name]()
+
+
+_BATCHERS: Dict[str, MicroBatcher] = {}
+_BATCHERS_LOCK = threading.Lock()
+
+
+def _forget_batchers_after_fork() -> None:
+    # Dispatch threads do not survive fork; a child keeps the loaded pipelines
+    # and builds fresh batchers around them on first use
+    global _BATCHERS_LOCK
+    _BATCHERS.clear()
+    _BATCHERS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_batchers_after_fork)
+
+
+def get_batcher(name: str) -> MicroBatcher:
+    """Return the shared micro-batching scheduler in front of a registry alias."""
+    if name not in _GETTERS:
+        raise KeyError(f"Unknown model alias: {name}")
+    with _BATCHERS_LOCK:
+        if name not in _BATCHERS:
+            # Dispatch runs under the alias' CPU thread budget
+            fn = get_resource_manager().wrap(name, _GETTERS[name]())
+            _BATCHERS[name] = MicroBatcher(fn, name=name, **BATCHING.get(name, {}))
+        return _BATCHERS[name]
+
+
+def batching_stats() -> Dict[str, BatchStats]:
+    """Return queue-depth, batch-size and wait-time stats for active batchers."""
+    with _BATCHERS_LOCK:
+        batchers = list(_BATCHERS.values())
+    return {batcher.name: batcher.stats() for batcher in batchers}
+
+
+def sweep_threads(name: str, sample_inputs: list, **kwargs: Any) -> list:
+    """Find the fastest intra-op thread count for an alias on this machine.
+
+    The winner is applied to the shared resource manager; see
+    :meth:`CpuResourceManager.sweep` for the remaining options.
+    """
+    if name not in _GETTERS:
+        raise KeyError(f"Unknown model alias: {name}")
+    return get_resource_manager().sweep(name, _GETTERS[name](), sample_inputs, **kwargs)
@@ -0,0 +1,127 @@
+"""Server-side filtering, sorting and pagination for dashboard record lists."""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+PAGE_SIZES = (10, 25, 50, 100)
+
+Record = Dict[str, str]
+
+_DEADLINE_FORMATS = (
+    "%Y-%m-%d",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%b %d %Y",
+    "%B %d %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+    "%m/%d/%Y",
+    "%m/%d/%y",
+)
+# Month and day only ("Oct 22"): read as the current year, not strptime's 1900
+_YEARLESS_FORMATS = ("%b %d %Y", "%B %d %Y")
+_ORDINAL = re.compile(r"(\d)(st|nd|rd|th)\b")
+
+
+@dataclass
+class Page:
+    records: List[Record]
+    page: int  # 1-based, clamped to [1, pages]
+    pages: int
+    total: int  # records left after filtering
+    start: int  # 0-based offset of the first record on this page
+
+
+def parse_deadline(text: str, year: Optional[int] = None) -> Optional[datetime]:
+    """Best-effort date parse for free-text deadlines ("Oct 22, 2021", "10/22/21").
+
+    Month-and-day deadlines ("Oct 22") fall in ``year``, the current year by default.
+    """
+    return _parse_deadline(text, datetime.now().year if year is None else year)
+
+
+# The year is part of the key, so cached yearless dates never go stale at New Year
+@lru_cache(maxsize=4096)
+def _parse_deadline(text: str, year: int) -> Optional[datetime]:
+    cleaned = _ORDINAL.sub(r"\1", " ".join(text.replace(".", " ").split()))
+    for fmt in _DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt)
+        except ValueError:
+            continue
+    with_year = f"{cleaned} {year}"
+    for fmt in _YEARLESS_FORMATS:
+        try:
+            return datetime.strptime(with_year, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def filter_records(
+    records: Sequence[Record],
+    query: str = "",
+    fields: Optional[Sequence[str]] = None,
+    owner: Optional[str] = None,
+    owner_field: str = "responsible",
+) -> List[Record]:
+    """Keep records whose ``fields`` contain ``query`` (case-insensitive) and match ``owner``.
+
+    ``owner=""`` selects unassigned records; ``None`` disables the owner filter.
+    """
+    needle = query.strip().lower()
+    out = []
+    for record in records:
+        if owner is not None and (record.get(owner_field) or "") != owner:
+            continue
+        if needle:
+            haystack = record.values() if fields is None else (record.get(f, "") for f in fields)
+            if not any(needle in str(value).lower() for value in haystack):
+                continue
+        out.append(record)
+    return out
+
+
+def sort_records(records: List[Record], field: Optional[str], descending: bool = False) -> List[Record]:
+    """Stable sort by ``field``; ``"deadline"`` sorts by parsed date. Blank values go last."""
+    if not field:
+        return list(records)
+    if field == "deadline":
+        # Parsed dates in date order, then undated phrases ("Immediate"), then blanks
+        dated, phrases, blank = [], [], []
+        year = datetime.now().year
+        for record in records:
+            text = record.get(field) or ""
+            parsed = parse_deadline(text, year) if text else None
+            if parsed is not None:
+                dated.append((parsed, record))
+            else:
+                (phrases if text else blank).append(record)
+        dated.sort(key=lambda item: item[0], reverse=descending)
+        phrases.sort(key=lambda record: record[field].lower())
+        return [record for _, record in dated] + phrases + blank
+    filled = [record for record in records if record.get(field)]
+    blank = [record for record in records if not record.get(field)]
+    filled.sort(key=lambda record: str(record[field]).lower(), reverse=descending)
+    return filled + blank
+
+
+def paginate(records: Sequence[Record], page: int, page_size: int) -> Page:
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    total = len(records)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), pages)
+    start = (page - 1) * page_size
+    return Page(
+        records=list(records[start : start + page_size]),
+        page=page,
+        pages=pages,
+        total=total,
+        start=start,
+    )
@@ -0,0 +1,114 @@
+"""Load registry models once, then fork workers that share the weights copy-on-write."""
+from __future__ import annotations
+
+import gc
+import multiprocessing as mp
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import model_registry
+from .resources import get_resource_manager
+
+_SMAPS_FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+
+def process_memory(pid: Optional[int] = None) -> Dict[str, float]:
+    """RSS/PSS breakdown in MiB from ``/proc/<pid>/smaps_rollup`` (Linux only).
+
+    PSS splits every shared page between the processes mapping it, so the sum
+    of PSS over a parent and its workers is their true combined footprint.
+    Returns an empty dict where the file is unavailable.
+    """
+    path = f"/proc/{pid if pid is not None else 'self'}/smaps_rollup"
+    usage: Dict[str, float] = {}
+    try:
+        with open(path, "r", encoding="ascii") as fp:
+            for line in fp:
+                key, _, rest = line.partition(":")
+                if key in _SMAPS_FIELDS:
+                    usage[key.lower() + "_mb"] = round(int(rest.split()[0]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return {}
+    return usage
+
+
+def prewarm(aliases: Optional[Iterable[str]] = None) -> Dict[str, float]:
+    """Build the registry pipelines for ``aliases`` (default: all) in this process.
+
+    Only the pipelines are created — batchers start threads, which must not
+    exist at fork time. Afterwards every surviving object is moved to the
+    permanent GC generation with ``gc.freeze()``; collections in forked
+    children then never touch (and so never copy) the parent's pages.
+    Returns load seconds per alias.
+    """
+    timings: Dict[str, float] = {}
+    for alias in aliases if aliases is not None else model_registry.MODEL_REGISTRY:
+        start = time.perf_counter()
+        model_registry.get_pipeline(alias)
+        timings[alias] = round(time.perf_counter() - start, 3)
+    gc.collect()
+    gc.freeze()
+    return timings
+
+
+def _run_worker(
+    index: int,
+    num_workers: int,
+    pin: bool,
+    target: Callable[..., Any],
+    args: tuple,
+) -> None:
+    get_resource_manager().configure_worker(index, num_workers, pin=pin)
+    target(index, *args)
+
+
+@dataclass
+class PrewarmedWorkers:
+    """Pre-warm the registry in the parent and fork ``num_workers`` children.
+
+    Each child runs ``target(index, *args)`` with its share of the cores (see
+    :meth:`CpuResourceManager.configure_worker`) and starts with the models
+    already loaded. Requires the ``fork`` start method (Linux/macOS).
+    """
+
+    num_workers: int
+    aliases: Optional[List[str]] = None
+    pin: bool = False
+    load_seconds: Dict[str, float] = field(default_factory=dict)
+    fork_seconds: float = 0.0
+    processes: List[Any] = field(default_factory=list)
+
+    def start(self, target: Callable[..., Any], *args: Any) -> "PrewarmedWorkers":
+        if self.num_workers <= 0:
+            raise ValueError("num_workers must be positive")
+        if "fork" not in mp.get_all_start_methods():
+            raise RuntimeError("Pre-warmed workers need the fork start method")
+        if model_registry.batching_stats():
+            raise RuntimeError("Start workers before any batcher threads are running")
+        self.load_seconds = prewarm(self.aliases)
+        ctx = mp.get_context("fork")
+        start = time.perf_counter()
+        for index in range(self.num_workers):
+            process = ctx.Process(
+                target=_run_worker,
+                args=(index, self.num_workers, self.pin, target, args),
+                name=f"prewarmed-worker-{index}",
+            )
+            process.start()
+            self.processes.append(process)
+        self.fork_seconds = round(time.perf_counter() - start, 3)
+        return self
+
+    def memory(self) -> Dict[str, Any]:
+        """Per-process RSS/PSS for the parent and each live worker."""
+        return {
+            "parent": process_memory(),
+            "workers": [process_memory(process.pid) for process in self.processes],
+        }
+
+    def join(self, timeout: Optional[float] = None) -> List[Optional[int]]:
+        """Wait for the workers and return their exit codes."""
+        for process in self.processes:
+            process.join(timeout)
+        return [process.exitcode for process in self.processes]
@@ -0,0 +1,247 @@
+"""CPU thread budgeting for torch-backed pipelines sharing one process."""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+def available_cores() -> List[int]:
+    """Cores this process may run on (respects taskset/cgroup affinity)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _torch():
+    """Import torch lazily; stub backends (e.g. offline load tests) run without it."""
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch
+
+
+@dataclass
+class ThreadBudget:
+    intra_op: int
+    inter_op: int = 1
+
+
+@dataclass
+class _Usage:
+    calls: int = 0
+    active: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    thread_seconds: float = 0.0  # wall time x intra-op threads granted
+
+
+class CpuResourceManager:
+    """Hand out intra-op thread counts per model alias and track utilization.
+
+    Aliases without an explicit budget share the cores evenly with whichever
+    other aliases are running inference at the same moment, so a lone request
+    still gets the whole machine while concurrent stages stop oversubscribing.
+    """
+
+    def __init__(self, cores: Optional[Sequence[int]] = None) -> None:
+        self.cores = list(cores) if cores is not None else available_cores()
+        self.budgets: Dict[str, ThreadBudget] = {}
+        self._usage: Dict[str, _Usage] = {}
+        self._lock = threading.Lock()
+        self._interop_configured = False
+        # torch's thread count is process-wide: saved by the first open scope,
+        # restored by the last one to close
+        self._open_scopes = 0
+        self._saved_threads: Optional[int] = None
+
+    @property
+    def total_cores(self) -> int:
+        return max(1, len(self.cores))
+
+    def set_budget(self, alias: str, intra_op: int, inter_op: int = 1) -> None:
+        if intra_op <= 0 or inter_op <= 0:
+            raise ValueError("thread counts must be positive")
+        self.budgets[alias] = ThreadBudget(intra_op=intra_op, inter_op=inter_op)
+
+    def budget_for(self, alias: str) -> ThreadBudget:
+        if alias in self.budgets:
+            return self.budgets[alias]
+        with self._lock:
+            active = sum(1 for usage in self._usage.values() if usage.active) or 1
+        return ThreadBudget(intra_op=max(1, self.total_cores // active))
+
+    def configure_process(self, inter_op: Optional[int] = None) -> None:
+        """Set torch's inter-op pool once; torch rejects changes after parallel work starts."""
+        if self._interop_configured:
+            return
+        self._interop_configured = True
+        threads = inter_op or max([b.inter_op for b in self.budgets.values()] or [1])
+        torch = _torch()
+        if torch is None:
+            return
+        try:
+            torch.set_num_interop_threads(threads)
+        except RuntimeError:
+            pass  # already fixed by earlier parallel work in this process
+
+    def configure_worker(self, index: int, num_workers: int, pin: bool = False) -> List[int]:
+        """Restrict this process to its share of the cores (worker ``index`` of ``num_workers``).
+
+        With ``pin`` the process is bound to that core set via ``sched_setaffinity``.
+        Returns the cores assigned to the worker.
+        """
+        if num_workers <= 0 or not 0 <= index < num_workers:
+            raise ValueError("index must be within [0, num_workers)")
+        per_worker = max(1, len(self.cores) // num_workers)
+        start = (index * per_worker) % len(self.cores)
+        assigned = self.cores[start : start + per_worker] or self.cores[:1]
+        if pin and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, assigned)
+        self.cores = assigned
+        torch = _torch()
+        if torch is not None:
+            torch.set_num_threads(len(assigned))
+        return assigned
+
+    @contextmanager
+    def scope(self, alias: str) -> Iterator[ThreadBudget]:
+        """Run one inference call under ``alias``'s intra-op thread budget."""
+        with self._lock:
+            usage = self._usage.setdefault(alias, _Usage())
+            usage.active += 1
+        budget = self.budget_for(alias)
+        torch = _torch()
+        with self._lock:
+            if torch is not None:
+                if self._open_scopes == 0:
+                    self._saved_threads = torch.get_num_threads()
+                torch.set_num_threads(budget.intra_op)
+            self._open_scopes += 1
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield budget
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            with self._lock:
+                self._open_scopes -= 1
+                if torch is not None and self._open_scopes == 0:
+                    torch.set_num_threads(self._saved_threads)
+                usage.active -= 1
+                usage.calls += 1
+                usage.wall_seconds += wall
+                usage.cpu_seconds += cpu
+                usage.thread_seconds += wall * budget.intra_op
+
+    def wrap(self, alias: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``fn`` with every call run inside :meth:`scope`."""
+
+        def run(*args: Any, **kwargs: Any) -> Any:
+            with self.scope(alias):
+                return fn(*args, **kwargs)
+
+        return run
+
+    def utilization(self) -> dict:
+        """Process CPU time plus per-alias counters.
+
+        ``cpu_seconds`` per alias covers the dispatching thread only; compare
+        ``thread_seconds`` (wall time x threads granted) against process CPU
+        time to see how well the granted threads were kept busy.
+        """
+        with self._lock:
+            aliases = {
+                alias: {
+                    "calls": usage.calls,
+                    "active": usage.active,
+                    "wall_seconds": round(usage.wall_seconds, 4),
+                    "cpu_seconds": round(usage.cpu_seconds, 4),
+                    "thread_seconds": round(usage.thread_seconds, 4),
+                    "intra_op": self.budgets[alias].intra_op if alias in self.budgets else None,
+                }
+                for alias, usage in self._usage.items()
+            }
+        return {
+            "cores": list(self.cores),
+            "process_cpu_seconds": round(time.process_time(), 4),
+            "aliases": aliases,
+        }
+
+    def sweep(
+        self,
+        alias: str,
+        fn: Callable[..., Any],
+        inputs: List[Any],
+        candidates: Optional[Sequence[int]] = None,
+        repeats: int = 2,
+        apply: bool = True,
+    ) -> List[dict]:
+        """Time ``fn(inputs)`` at several intra-op thread counts and keep the fastest.
+
+        Results are sorted by throughput (items per second), best first.
+        """
+        if not inputs:
+            raise ValueError("sweep needs at least one sample input")
+        torch = _torch()
+        if torch is None:
+            raise ImportError("Thread sweeps require torch")
+        if candidates is None:
+            powers = {1, 2, 4, 8, 16, 32, 64, self.total_cores}
+            candidates = sorted(n for n in powers if n <= self.total_cores)
+        previous = torch.get_num_threads()
+        results = []
+        try:
+            fn(inputs, batch_size=len(inputs))  # warm-up: weights, caches, allocator
+            for threads in candidates:
+                torch.set_num_threads(threads)
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    fn(inputs, batch_size=len(inputs))
+                elapsed = (time.perf_counter() - start) / repeats
+                results.append(
+                    {
+                        "alias": alias,
+                        "intra_op": threads,
+                        "seconds_per_batch": round(elapsed, 4),
+                        "items_per_second": round(len(inputs) / elapsed, 3) if elapsed else 0.0,
+                    }
+                )
+        finally:
+            torch.set_num_threads(previous)
+        results.sort(key=lambda row: row["items_per_second"], reverse=True)
+        if apply:
+            self.set_budget(alias, results[0]["intra_op"])
+        return results
+
+
+_MANAGER: Optional[CpuResourceManager] = None
+_MANAGER_LOCK = threading.Lock()
+
+
+def _reset_locks_after_fork() -> None:
+    # Another thread may have held a lock at fork time; the child gets fresh ones
+    global _MANAGER_LOCK
+    _MANAGER_LOCK = threading.Lock()
+    if _MANAGER is not None:
+        _MANAGER._lock = threading.Lock()
+        # Scopes open in the parent's dispatch threads never close in the child
+        _MANAGER._open_scopes = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+
+def get_resource_manager() -> CpuResourceManager:
+    """Return the process-wide resource manager."""
+    global _MANAGER
+    with _MANAGER_LOCK:
+        if _MANAGER is None:
+            _MANAGER = CpuResourceManager()
+        return _MANAGER
@@ -0,0 +1,85 @@
+"""Deterministic stand-ins for the registry pipelines, for offline load tests."""
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List
+
+
+class StubPipeline:
+    """Mimic a Hugging Face pipeline's call signature and output shapes.
+
+    Each call sleeps ``base_ms + per_item_ms * len(batch) + per_kchar_ms *
+    kchars`` to model inference cost; sleeping releases the GIL the way real
+    torch kernels do, so concurrency behaves realistically. ``weights_mb``
+    allocates and touches a read-only buffer standing in for model weights, so
+    memory experiments (e.g. forked workers) see resident pages.
+    """
+
+    def __init__(
+        self,
+        task: str,
+        base_ms: float = 20.0,
+        per_item_ms: float = 5.0,
+        per_kchar_ms: float = 2.0,
+        weights_mb: float = 0.0,
+    ) -> None:
+        self.task = task
+        self.base_ms = base_ms
+        self.per_item_ms = per_item_ms
+        self.per_kchar_ms = per_kchar_ms
+        # Filled on allocation, so every page is resident from the start
+        self.weights = b"\x01" * int(weights_mb * 1024 * 1024)
+
+    def __call__(self, inputs: Any, batch_size: int = 1, **kwargs: Any) -> List[Any]:
+        single = not isinstance(inputs, list)
+        batch = [inputs] if single else inputs
+        kchars = sum(len(item) for item in batch if isinstance(item, str)) / 1000.0
+        time.sleep(
+            (self.base_ms + self.per_item_ms * len(batch) + self.per_kchar_ms * kchars) / 1000.0
+        )
+        outputs = [self._output(item) for item in batch]
+        if self.task == "image-to-text":
+            # Image pipelines return one list of candidates per input
+            return outputs if single else [[output] for output in outputs]
+        return outputs
+
+    def _output(self, item: Any) -> Dict[str, str]:
+        text = item if isinstance(item, str) else getattr(item, "filename", "image")
+        words = text.split()
+        if self.task == "summarization":
+            return {"summary_text": " ".join(words[:25])}
+        if self.task == "image-to-text":
+            return {"generated_text": f"a slide with {len(words)} words of text"}
+        lines = [line for line in text.splitlines() if ":" in line][-3:]
+        payload = [
+            {
+                "action": line.split(":", 1)[1].strip()[:80],
+                "owner": line.split(":", 1)[0].strip(),
+                "deadline": "",
+                "decision": line.split(":", 1)[1].strip()[:80],
+                "support": line.strip()[:120],
+            }
+            for line in lines
+        ]
+        return {"generated_text": json.dumps(payload)}
+
+
+def stub_factory(
+    base_ms: float = 20.0,
+    per_item_ms: float = 5.0,
+    per_kchar_ms: float = 2.0,
+    weights_mb: float = 0.0,
+):
+    """Pipeline factory for :func:`set_pipeline_factory` building :class:`StubPipeline` objects."""
+
+    def build(name: str, info: Dict[str, Any]) -> StubPipeline:
+        return StubPipeline(
+            info["task"],
+            base_ms=base_ms,
+            per_item_ms=per_item_ms,
+            per_kchar_ms=per_kchar_ms,
+            weights_mb=weights_mb,
+        )
+
+    return build
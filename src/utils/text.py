@@ -1,8 +1,11 @@
 """Utility helpers for working with long meeting transcripts."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+import mmap
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
 
 
 @dataclass
@@ -14,24 +17,156 @@ class TextChunk:
     end: int
 
 
-def chunk_text(text: str, max_chars: int = 3500, overlap: int = 200) -> List[TextChunk]:
-    """Split long transcripts into overlapping windows for model consumption."""
+class MappedText:
+    """A UTF-8 text file exposed through ``mmap`` without decoding it up front.
+
+    Offsets into a mapped source are byte offsets into the file, so chunk
+    ``start``/``end`` still point straight back at the original transcript.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._fp = path.open("rb")
+        size = os.fstat(self._fp.fileno()).st_size
+        # mmap cannot map an empty file; fall back to an empty buffer
+        self._data = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __enter__(self) -> "MappedText":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def slice(self, start: int, end: int) -> str:
+        return self._data[start:end].decode("utf-8", errors="replace")
+
+    def align(self, pos: int) -> int:
+        """Move ``pos`` back to the nearest UTF-8 character boundary."""
+        while 0 < pos < len(self._data) and (self._data[pos] & 0xC0) == 0x80:
+            pos -= 1
+        return pos
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b""
+        self._fp.close()
+
+
+TextSource = Union[str, MappedText]
+
+
+@dataclass(frozen=True)
+class ChunkView:
+    """Offset-only window over a source; text is sliced only when ``content`` is read."""
+
+    source: TextSource = field(repr=False)
+    start: int
+    end: int
+
+    @property
+    def content(self) -> str:
+        if isinstance(self.source, str):
+            return self.source[self.start : self.end]
+        return self.source.slice(self.start, self.end)
+
+    def materialize(self) -> TextChunk:
+        return TextChunk(content=self.content, start=self.start, end=self.end)
+
+
+def iter_chunks(
+    source: TextSource, max_chars: int = 3500, overlap: int = 200
+) -> Iterator[ChunkView]:
+    """Lazily yield the windows :func:`chunk_text` would produce, as offset-only views."""
     if max_chars <= 0:
         raise ValueError("max_chars must be positive")
     if overlap < 0:
         raise ValueError("overlap cannot be negative")
 
-    chunks: List[TextChunk] = []
+    align = source.align if isinstance(source, MappedText) else None
     start = 0
-    length = len(text)
+    length = len(source)
     while start < length:
         end = min(start + max_chars, length)
-        chunk = text[start:end]
-        chunks.append(TextChunk(content=chunk, start=start, end=end))
+        if align is not None:
+            # Never split a multi-byte character; always make progress
+            end = max(align(end), start + 1) if end < length else end
+        yield ChunkView(source=source, start=start, end=end)
         if end == length:
             break
-        start = max(0, end - overlap)
-    return chunks
+        next_start = max(0, end - overlap)
+        if align is not None:
+            next_start = align(next_start)
+            if next_start <= start:
+                next_start = end  # overlap would stall on a multi-byte boundary
+        start = next_start
+
+
+def chunk_text(text: str, max_chars: int = 3500, overlap: int = 200) -> List[TextChunk]:
+    """Split long transcripts into overlapping windows for model consumption."""
+    return [view.materialize() for view in iter_chunks(text, max_chars=max_chars, overlap=overlap)]
+
+
+class IncrementalChunker:
+    """Produce the same windows as :func:`chunk_text` while text is still arriving.
+
+    ``feed`` returns windows as soon as they are closed (``max_chars`` long);
+    ``flush`` returns the final, shorter tail once the stream ends. Text before
+    the current window start is dropped, so memory stays bounded by one window.
+    """
+
+    def __init__(self, max_chars: int = 3500, overlap: int = 200) -> None:
+        if max_chars <= 0:
+            raise ValueError("max_chars must be positive")
+        if overlap < 0:
+            raise ValueError("overlap cannot be negative")
+        self.max_chars = max_chars
+        self.overlap = overlap
+        self._buffer = ""
+        self._offset = 0  # absolute position of self._buffer[0]
+        self._start = 0  # absolute start of the open window
+        self._last_end = 0  # end of the last closed window
+
+    @property
+    def length(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def feed(self, text: str) -> List[TextChunk]:
+        self._buffer += text
+        closed: List[TextChunk] = []
+        while self.length >= self._start + self.max_chars:
+            end = self._start + self.max_chars
+            closed.append(self._window(self._start, end))
+            self._last_end = end
+            self._start = max(0, end - self.overlap)
+        self._trim()
+        return closed
+
+    def pending(self) -> Optional[TextChunk]:
+        """Return the open tail window without closing it."""
+        if self.length <= self._last_end:
+            return None
+        return self._window(self._start, self.length)
+
+    def flush(self) -> Optional[TextChunk]:
+        """Close and return the final tail window, if any text is unprocessed."""
+        tail = self.pending()
+        if tail is not None:
+            self._last_end = tail.end
+        return tail
+
+    def _window(self, start: int, end: int) -> TextChunk:
+        content = self._buffer[start - self._offset : end - self._offset]
+        return TextChunk(content=content, start=start, end=end)
+
+    def _trim(self) -> None:
+        drop = self._start - self._offset
+        if drop > 0:
+            self._buffer = self._buffer[drop:]
+            self._offset = self._start
 
 
 def merge_bullets(items: Iterable[str]) -> str:
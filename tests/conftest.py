@@ -0,0 +1,66 @@
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+# Tests import the project the same way scripts/ does: from the repo root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.utils import budgets, model_registry  # noqa: E402
+from src.utils.stub_models import StubPipeline  # noqa: E402
+
+
+class RecordingStub(StubPipeline):
+    """Stub pipeline that appends its alias to a shared call log on every call."""
+
+    def __init__(self, alias: str, calls: List[str], task: str, **timing) -> None:
+        super().__init__(task, **timing)
+        self.alias = alias
+        self.calls = calls
+
+    def __call__(self, inputs, batch_size=1, **kwargs):
+        self.calls.append(self.alias)
+        return super().__call__(inputs, batch_size=batch_size, **kwargs)
+
+
+@dataclass
+class StubRegistry:
+    pipelines: Dict[str, RecordingStub] = field(default_factory=dict)
+    calls: List[str] = field(default_factory=list)
+
+
+@pytest.fixture
+def stub_registry(request, monkeypatch):
+    """Route every registry alias to zero-latency stub pipelines.
+
+    Parametrize indirectly with a dict to change the stub timings (``base_ms``,
+    ``per_item_ms``, ``per_kchar_ms``), set ``max_wait_ms`` on every batcher, or
+    attach a ``tokenizer`` class (built via ``tokenizer(model_name)``) to each
+    pipeline. Yields the built pipelines and the alias of every pipeline call.
+    """
+    options = dict(getattr(request, "param", {}))
+    timing = {key: options.pop(key, 0) for key in ("base_ms", "per_item_ms", "per_kchar_ms")}
+    tokenizer = options.pop("tokenizer", None)
+    if "max_wait_ms" in options:
+        wait = options.pop("max_wait_ms")
+        for alias, config in model_registry.BATCHING.items():
+            monkeypatch.setitem(model_registry.BATCHING, alias, {**config, "max_wait_ms": wait})
+    if options:
+        raise ValueError(f"Unknown stub_registry options: {sorted(options)}")
+
+    registry = StubRegistry()
+
+    def build(name, info):
+        pipeline = RecordingStub(name, registry.calls, info["task"], **timing)
+        if tokenizer is not None:
+            pipeline.tokenizer = tokenizer(info["model"])
+        registry.pipelines[name] = pipeline
+        return pipeline
+
+    model_registry.set_pipeline_factory(build)
+    budgets.reset_budget_stats()
+    yield registry
+    model_registry.set_pipeline_factory(None)
+    budgets.reset_budget_stats()
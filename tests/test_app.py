@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def pipeline_calls(stub_registry, monkeypatch):
+    """Alias of every stub pipeline call made while the app runs."""
+    monkeypatch.chdir(ROOT)
+    return stub_registry.calls
+
+
+def _custom_snippet_app() -> AppTest:
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60)
+    at.run()
+    at.sidebar.radio[0].set_value("Custom analysis").run()
+    next(box for box in at.sidebar.checkbox if "snippet" in box.label).check().run()
+    assert not at.exception
+    return at
+
+
+def test_log_interactions_do_not_rerun_analysis(pipeline_calls):
+    at = _custom_snippet_app()
+    analysis_calls = len(pipeline_calls)
+    assert analysis_calls > 0
+
+    at.selectbox(key="actions_sort").set_value("Deadline (soonest first)").run()
+    at.text_input(key="actions_query").set_value("budget").run()
+    at.selectbox(key="decisions_page_size").set_value(10).run()
+    assert not at.exception
+    assert len(pipeline_calls) == analysis_calls
+
+
+def test_owner_options_are_built_once_per_report(pipeline_calls):
+    at = _custom_snippet_app()
+    owners = at.session_state["actions_view"][2]
+    at.selectbox(key="actions_sort").set_value("Deadline (soonest first)").run()
+    at.text_input(key="actions_query").set_value("budget").run()
+    assert not at.exception
+    assert at.session_state["actions_view"][2] is owners
+
+
+def test_prepare_export_reuses_report_and_fingerprint(pipeline_calls, monkeypatch):
+    import src.analysis.exports as exports
+
+    fingerprints = []
+    original = exports.report_fingerprint
+
+    def counting_fingerprint(report):
+        fingerprints.append(1)
+        return original(report)
+
+    monkeypatch.setattr(exports, "report_fingerprint", counting_fingerprint)
+    at = _custom_snippet_app()
+    analysis_calls, fingerprint_calls = len(pipeline_calls), len(fingerprints)
+
+    next(button for button in at.button if "Prepare" in button.label).click().run()
+    assert not at.exception
+    assert at.get("download_button")
+    assert len(pipeline_calls) == analysis_calls
+    assert len(fingerprints) == fingerprint_calls
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from src.utils.batching import MicroBatcher
+
+
+class RecordingFn:
+    """Batch function that records each batch; ``gate`` holds the first call open."""
+
+    def __init__(self, gate: bool = False) -> None:
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not gate:
+            self.release.set()
+
+    def __call__(self, payloads, batch_size, **kwargs):
+        self.batches.append((list(payloads), kwargs))
+        self.started.set()
+        assert self.release.wait(10)
+        return [f"{payload}:{kwargs.get('mode', '')}" for payload in payloads]
+
+
+def test_full_batch_dispatches_without_waiting():
+    fn = RecordingFn()
+    batcher = MicroBatcher(fn, max_batch_size=4, max_wait_ms=60_000)
+    futures = [batcher.submit(idx) for idx in range(4)]
+    assert [future.result(timeout=5) for future in futures] == [f"{idx}:" for idx in range(4)]
+    assert fn.batches == [([0, 1, 2, 3], {})]
+    batcher.close()
+
+
+def test_partial_batch_dispatches_after_max_wait():
+    fn = RecordingFn()
+    batcher = MicroBatcher(fn, max_batch_size=8, max_wait_ms=50)
+    start = time.perf_counter()
+    futures = [batcher.submit(idx) for idx in range(2)]
+    assert [future.result(timeout=5) for future in futures] == ["0:", "1:"]
+    assert time.perf_counter() - start >= 0.05
+    assert fn.batches == [([0, 1], {})]
+    batcher.close()
+
+
+def test_requests_with_different_kwargs_never_share_a_batch():
+    fn = RecordingFn(gate=True)
+    batcher = MicroBatcher(fn, max_batch_size=8, max_wait_ms=0)
+    first = batcher.submit("warm", mode="a")
+    assert fn.started.wait(5)
+    futures = [(idx, mode, batcher.submit(idx, mode=mode)) for idx in range(12) for mode in "ab"]
+    fn.release.set()
+    assert first.result(timeout=5) == "warm:a"
+    # Each output is tagged with its batch's kwargs, so a mixed batch would mislabel one side
+    for idx, mode, future in futures:
+        assert future.result(timeout=5) == f"{idx}:{mode}"
+    batcher.close()
+    assert [(len(payloads), kwargs) for payloads, kwargs in fn.batches[1:]] == [
+        (8, {"mode": "a"}),
+        (8, {"mode": "b"}),
+        (4, {"mode": "a"}),
+        (4, {"mode": "b"}),
+    ]
+
+
+def test_exception_reaches_every_waiter():
+    failure = ValueError("model crashed")
+
+    def fail(payloads, batch_size, **kwargs):
+        raise failure
+
+    batcher = MicroBatcher(fail, max_batch_size=3, max_wait_ms=60_000)
+    futures = [batcher.submit(idx) for idx in range(3)]
+    for future in futures:
+        assert future.exception(timeout=5) is failure
+    batcher.close()
+
+
+def test_close_drains_queued_work():
+    fn = RecordingFn(gate=True)
+    batcher = MicroBatcher(fn, max_batch_size=2, max_wait_ms=0)
+    futures = [batcher.submit(0)]
+    assert fn.started.wait(5)
+    futures += [batcher.submit(idx) for idx in range(1, 6)]
+    closer = threading.Thread(target=batcher.close)
+    closer.start()
+    fn.release.set()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert [future.result(timeout=0) for future in futures] == [f"{idx}:" for idx in range(6)]
+    assert [payloads for payloads, _ in fn.batches] == [[0], [1, 2], [3, 4], [5]]
+    with pytest.raises(RuntimeError, match="closed"):
+        batcher.submit(6)
+
+
+def test_stats_report_queueing_and_batch_sizes():
+    fn = RecordingFn(gate=True)
+    batcher = MicroBatcher(fn, name="summarizer", max_batch_size=2, max_wait_ms=0)
+    futures = [batcher.submit(0)]
+    assert fn.started.wait(5)
+    futures += [batcher.submit(idx) for idx in range(1, 4)]
+    queued = batcher.stats()
+    assert (queued.queue_depth, queued.max_queue_depth, queued.batches, queued.items) == (3, 3, 1, 1)
+
+    fn.release.set()
+    for future in futures:
+        future.result(timeout=5)
+    batcher.close()
+    stats = batcher.stats()
+    assert stats.name == "summarizer"
+    assert (stats.queue_depth, stats.max_queue_depth) == (0, 3)
+    assert (stats.batches, stats.items, stats.max_batch_size) == (3, 4, 2)
+    assert stats.batch_size_histogram == {1: 2, 2: 1}
+    assert stats.mean_batch_size == pytest.approx(4 / 3)
+    assert 0 < stats.mean_wait_ms <= stats.max_wait_ms
+    assert stats.to_dict()["mean_batch_size"] == 1.333
@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from src.analysis.transcript import summarize_chunks
+from src.utils import budgets
+from src.utils.model_registry import MODEL_REGISTRY
+from src.utils.text import iter_chunks
+
+
+class BorrowCheckingTokenizer:
+    """Word tokenizer that fails like a fast tokenizer when shared across threads."""
+
+    def __init__(self, name_or_path: str) -> None:
+        self.name_or_path = name_or_path
+        self.owner = None
+
+    @classmethod
+    def from_pretrained(cls, name_or_path: str) -> "BorrowCheckingTokenizer":
+        return cls(name_or_path)
+
+    def __call__(self, text, **kwargs):
+        thread = threading.get_ident()
+        if self.owner is None:
+            self.owner = thread
+        if self.owner != thread:
+            raise RuntimeError("Already borrowed")
+        return {"input_ids": text.split()}
+
+
+TOKENIZING = pytest.mark.parametrize(
+    "stub_registry", [{"tokenizer": BorrowCheckingTokenizer}], ids=["tokenizing"], indirect=True
+)
+
+
+@TOKENIZING
+def test_counting_never_touches_the_pipeline_tokenizer(stub_registry):
+    text = "Clerk: publish the rental assistance FAQ by Friday"
+    assert budgets.count_tokens("summarizer", text) == len(text.split())
+    pipeline_tokenizer = stub_registry.pipelines["summarizer"].tokenizer
+    assert pipeline_tokenizer.owner is None
+    assert budgets._COUNTERS["summarizer"][1] is not pipeline_tokenizer
+
+
+@TOKENIZING
+def test_loading_one_alias_does_not_block_another(stub_registry, monkeypatch):
+    loading, release = threading.Event(), threading.Event()
+    slow_model = MODEL_REGISTRY["summarizer"]["model"]
+
+    def from_pretrained(name_or_path):
+        if name_or_path == slow_model:
+            loading.set()
+            release.wait(10)
+        return BorrowCheckingTokenizer(name_or_path)
+
+    monkeypatch.setattr(BorrowCheckingTokenizer, "from_pretrained", staticmethod(from_pretrained))
+    slow = threading.Thread(target=budgets.count_tokens, args=("summarizer", "a b c"))
+    slow.start()
+    assert loading.wait(10)
+    counted = []
+    other = threading.Thread(
+        target=lambda: counted.append(budgets.count_tokens("action_generator", "a b"))
+    )
+    other.start()
+    other.join(2)
+    blocked = other.is_alive()
+    release.set()
+    slow.join()
+    other.join()
+    assert not blocked
+    assert counted == [2]
+
+
+@TOKENIZING
+def test_generated_tokens_are_recorded(stub_registry):
+    transcript = "\n".join(f"Speaker {idx}: the council reviewed item {idx} today" for idx in range(40))
+    summaries = summarize_chunks(iter_chunks(transcript, max_chars=200, overlap=0))
+    stats = budgets.budget_stats()["summarizer"].to_dict()
+    assert stats["requests"] == len(summaries)
+    assert stats["generated_tokens"] == sum(len(summary.split()) for summary in summaries)
+    assert stats["generated_tokens"] <= stats["budget_max_steps"]
@@ -0,0 +1,81 @@
+import subprocess
+
+import pytest
+
+datasets = pytest.importorskip("datasets")
+
+from scripts import download_data  # noqa: E402
+from src.analysis.pipeline import load_meeting, load_transcript  # noqa: E402
+
+
+def _git_repo(path):
+    """Local stand-in for a remote dataset repository."""
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    (path / "README.md").write_text("stand-in\n", encoding="utf-8")
+    subprocess.run(["git", "add", "README.md"], cwd=path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-qm", "init"],
+        cwd=path,
+        check=True,
+    )
+    return path
+
+
+def _saved_dataset(path):
+    rows = {
+        "meeting_id": [f"m{idx}" for idx in range(6)],
+        "source": [f"Speaker {idx}: item {idx}" for idx in range(6)],
+    }
+    datasets.DatasetDict(
+        {"train": datasets.Dataset.from_dict(rows), "test": datasets.Dataset.from_dict(rows)}
+    ).save_to_disk(str(path))
+    return path
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.setattr(download_data, "DATA_DIR", download_data.DATA_DIR)
+    return [
+        "--data-dir", str(tmp_path / "data"),
+        "--mised-url", str(_git_repo(tmp_path / "mised_remote")),
+        "--public-meetings-url", str(_git_repo(tmp_path / "public_remote")),
+        "--meetingbank-source", str(_saved_dataset(tmp_path / "meetingbank_saved")),
+    ]
+
+
+def test_second_run_skips_every_split(sources, tmp_path, capsys):
+    argv = sources + ["--shards", "2", "--compression", "gzip"]
+    download_data.main(argv)
+    first = capsys.readouterr().out
+    assert first.count("Saved MeetingBank split") == 2
+    export_dir = tmp_path / "data" / "meetingbank"
+    mtimes = {path.name: path.stat().st_mtime_ns for path in export_dir.glob("*.jsonl.gz")}
+    assert len(mtimes) == 4
+
+    download_data.main(argv)
+    second = capsys.readouterr().out
+    assert "Saved MeetingBank split" not in second
+    assert second.count("already current") == 4  # two clones, two splits
+    assert {path.name: path.stat().st_mtime_ns for path in export_dir.glob("*.jsonl.gz")} == mtimes
+
+    # Compressed shards stream through load_transcript; indexed access refuses them
+    shard = export_dir / "train-00000-of-00002.jsonl.gz"
+    assert load_transcript(shard) == "\n".join(f"Speaker {idx}: item {idx}" for idx in range(3))
+    with pytest.raises(ValueError, match="uncompressed"):
+        load_meeting(shard, meeting_id="m0")
+
+
+def test_split_without_fingerprint_is_exported_again(sources, monkeypatch, capsys):
+    load = download_data._load_meetingbank
+
+    def without_fingerprint(source):
+        dataset = load(source)
+        for split_ds in dataset.values():
+            split_ds._fingerprint = None
+        return dataset
+
+    monkeypatch.setattr(download_data, "_load_meetingbank", without_fingerprint)
+    download_data.main(sources)
+    download_data.main(sources)
+    assert capsys.readouterr().out.count("Saved MeetingBank split") == 4
@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+
+from src.analysis.pipeline import load_meeting
+from src.utils.jsonl_index import JsonlIndex, JsonlReader, index_path_for, load_or_build_index
+
+
+def _write_rows(path, rows, trailing_newline=True):
+    text = "\n".join(json.dumps(row) for row in rows)
+    path.write_text(text + ("\n" if trailing_newline else ""), encoding="utf-8")
+    return path
+
+
+ROWS = [
+    {"meeting_id": "a", "source": "Clerk: call to order"},
+    {"meeting_id": "b", "source": "Chair: item one"},
+    {"meeting_id": "a", "source": "Clerk: adjourned"},
+]
+
+
+def test_lookup_by_meeting_id_and_line(tmp_path):
+    path = _write_rows(tmp_path / "corpus.jsonl", ROWS)
+    with JsonlReader(path) as reader:
+        assert len(reader) == 3
+        assert reader.meeting("a") == [ROWS[0], ROWS[2]]
+        assert reader.line(1) == ROWS[1]
+        with pytest.raises(KeyError):
+            reader.meeting("missing")
+        with pytest.raises(IndexError):
+            reader.line(3)
+    assert index_path_for(path).exists()
+    assert load_meeting(path, meeting_id="a") == "Clerk: call to order\nClerk: adjourned"
+    assert load_meeting(path, line=1) == "Chair: item one"
+
+
+def test_appended_row_is_picked_up(tmp_path):
+    path = _write_rows(tmp_path / "corpus.jsonl", ROWS)
+    with JsonlReader(path) as reader:
+        assert reader.meeting("b") == [ROWS[1]]
+        with path.open("a", encoding="utf-8") as fp:
+            fp.write(json.dumps({"meeting_id": "b", "source": "Chair: item two"}) + "\n")
+        assert len(reader) == 4
+        assert [row["source"] for row in reader.meeting("b")] == ["Chair: item one", "Chair: item two"]
+    assert JsonlIndex.load(index_path_for(path)).is_current(path)
+
+
+def test_same_size_rewrite_is_detected_by_mtime(tmp_path):
+    path = _write_rows(tmp_path / "corpus.jsonl", ROWS)
+    first = load_or_build_index(path)
+    _write_rows(path, [ROWS[2], ROWS[1], ROWS[0]])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000_000))
+    assert path.stat().st_size == first.size
+    assert load_or_build_index(path).ids["a"] == [0, 2]
+    with JsonlReader(path) as reader:
+        assert reader.line(0) == ROWS[2]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+    with JsonlReader(path) as reader:
+        assert len(reader) == 0
+        assert reader.index.ids == {}
+        with pytest.raises(IndexError):
+            reader.line(0)
+        with pytest.raises(KeyError):
+            reader.meeting("a")
+
+
+def test_final_line_without_trailing_newline(tmp_path):
+    path = _write_rows(tmp_path / "corpus.jsonl", ROWS, trailing_newline=False)
+    with JsonlReader(path) as reader:
+        assert len(reader) == 3
+        assert reader.line(2) == ROWS[2]
+        assert reader.meeting("a") == [ROWS[0], ROWS[2]]
@@ -0,0 +1,42 @@
+import random
+
+from src.analysis.data_structures import VisualInsight
+from src.analysis.linking import _block_counts, _term_counts, link_visuals
+from src.utils.text import iter_chunks
+
+
+def test_block_counts_match_per_chunk_counters():
+    rng = random.Random(0)
+    alphabet = "abthe1 9Z.é\n-'K"
+    for _ in range(2000):
+        texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(3)]
+        term_ids = {}
+        rows, ids, counts = _block_counts(texts, {}, term_ids)
+        terms = {term_id: term for term, term_id in term_ids.items()}
+        found = {(row, terms[term_id]): count for row, term_id, count in zip(rows, ids, counts)}
+        expected = {
+            (row, term): count
+            for row, text in enumerate(texts)
+            for term, count in _term_counts(text).items()
+        }
+        assert found == expected
+
+
+def test_captions_link_to_the_chunks_that_discuss_them():
+    topics = ["rental assistance", "zoning variance", "transit budget", "library hours"]
+    transcript = "\n".join(
+        f"Speaker {idx % 3}: the council discussed the {topics[idx // 20]} item {idx} at length."
+        for idx in range(80)
+    )
+    chunks = list(iter_chunks(transcript, max_chars=400, overlap=0))
+    visuals = [
+        VisualInsight("a.png", "A slide showing the zoning variance map"),
+        VisualInsight("b.png", "Screenshot of library hours"),
+    ]
+    link_visuals(visuals, chunks)
+    for visual, words in zip(visuals, (("zoning", "variance"), ("library", "hours"))):
+        assert visual.linked_topics
+        for link in visual.linked_topics:
+            chunk = chunks[int(link.split(":")[0].split()[1]) - 1]
+            assert any(word in chunk.content for word in words)
+            assert any(word in link for word in words)
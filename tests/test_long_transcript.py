@@ -0,0 +1,79 @@
+import json
+import random
+import tracemalloc
+
+import pytest
+
+from src.analysis import long_transcript
+from src.analysis.data_structures import ActionItem
+from src.analysis.long_transcript import RssGuard, build_long_meeting_report
+
+WORDS = (
+    "budget housing motion staff review report zoning permit council district rental "
+    "assistance hearing parcel variance transit library parks water sewer contract "
+    "audit payroll clerk ordinance amendment vote public comment schedule grant"
+).split()
+
+
+# Zero-latency stubs with batcher waits turned off
+NO_WAIT = pytest.mark.parametrize(
+    "stub_registry", [{"max_wait_ms": 0.0}], ids=["no_wait"], indirect=True
+)
+
+
+def _write_transcript(path, rows):
+    rng = random.Random(0)
+    with path.open("w", encoding="utf-8") as fp:
+        for idx in range(rows):
+            words = " ".join(rng.choice(WORDS) for _ in range(30))
+            fp.write(json.dumps({"source": f"Speaker {idx % 7}: item {idx} {words}"}) + "\n")
+    return path
+
+
+def _working_peak(path, spill_dir):
+    """Peak traced allocations minus what the returned report keeps alive."""
+    tracemalloc.start()
+    try:
+        report = build_long_meeting_report(path, spill_dir=spill_dir)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert report.action_items
+    return peak - current
+
+
+@NO_WAIT
+def test_working_memory_stays_flat_as_transcript_grows(stub_registry, tmp_path):
+    small_path = _write_transcript(tmp_path / "small.jsonl", 2_000)
+    build_long_meeting_report(small_path, spill_dir=tmp_path / "spill")  # warm caches and batchers
+    small = _working_peak(small_path, tmp_path / "spill")
+    large = _working_peak(_write_transcript(tmp_path / "large.jsonl", 20_000), tmp_path / "spill")
+    # 10x the input; working memory may wobble but must not scale with it
+    assert large < 2 * small + 256 * 1024
+
+
+@NO_WAIT
+def test_rss_guard_reports_peak(stub_registry, tmp_path):
+    guard = RssGuard()
+    path = _write_transcript(tmp_path / "meeting.jsonl", 200)
+    build_long_meeting_report(path, spill_dir=tmp_path / "spill", rss_guard=guard)
+    assert guard.peak_mb > 0
+
+
+def test_later_duplicate_fills_blank_fields_across_groups(monkeypatch, tmp_path):
+    restated = [
+        [ActionItem("Publish the rental assistance FAQ for all districts", "", "", "first")],
+        [ActionItem("Publish the rental assistance FAQ for all districts", "Staff", "Oct 22", "")],
+    ]
+
+    def extract_actions(group):
+        return restated.pop(0) if restated else []
+
+    stages = (lambda group: ["summary"] * len(group), extract_actions, lambda group: [])
+    monkeypatch.setattr(long_transcript, "tier_stages", lambda tier, escalate: stages)
+    path = tmp_path / "meeting.txt"
+    path.write_text("\n".join(f"Speaker 1: line {idx} of the hearing" for idx in range(40)))
+    report = build_long_meeting_report(path, group_size=1, max_chars=400, overlap=0)
+    assert [(item.owner, item.deadline, item.support) for item in report.action_items] == [
+        ("Staff", "Oct 22", "first")
+    ]
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from src.utils.paging import parse_deadline, sort_records
+
+
+def test_yearless_deadline_uses_the_given_year():
+    assert parse_deadline("Oct 22", year=2020) == datetime(2020, 10, 22)
+    # Cached per year: the same text in another year is parsed again
+    assert parse_deadline("Oct 22", year=2021) == datetime(2021, 10, 22)
+    assert parse_deadline("Oct 22") == datetime(datetime.now().year, 10, 22)
+    assert parse_deadline("Oct 22, 2019", year=2020) == datetime(2019, 10, 22)
+
+
+def test_deadline_sort_orders_dates_then_phrases_then_blanks():
+    records = [{"deadline": text} for text in ("", "Immediate", "Oct 22, 2021", "2021-01-05")]
+    assert [r["deadline"] for r in sort_records(records, "deadline")] == [
+        "2021-01-05",
+        "Oct 22, 2021",
+        "Immediate",
+        "",
+    ]
@@ -0,0 +1,32 @@
+from src.utils import resources
+from src.utils.resources import CpuResourceManager
+
+
+class FakeTorch:
+    def __init__(self, threads):
+        self.threads = threads
+
+    def get_num_threads(self):
+        return self.threads
+
+    def set_num_threads(self, threads):
+        self.threads = threads
+
+
+def test_interleaved_scopes_restore_the_original_thread_count(monkeypatch):
+    torch = FakeTorch(8)
+    monkeypatch.setattr(resources, "_torch", lambda: torch)
+    manager = CpuResourceManager(cores=range(8))
+    manager.set_budget("summarizer", 2)
+    manager.set_budget("action_generator", 4)
+
+    first = manager.scope("summarizer")
+    second = manager.scope("action_generator")
+    first.__enter__()
+    assert torch.threads == 2
+    second.__enter__()
+    assert torch.threads == 4
+    first.__exit__(None, None, None)  # exits out of order: must not restore yet
+    assert torch.threads == 4
+    second.__exit__(None, None, None)
+    assert torch.threads == 8
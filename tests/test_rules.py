@@ -0,0 +1,29 @@
+from src.analysis.rules import ESCALATION_THRESHOLD, rule_actions
+
+
+def test_sentence_openers_are_not_owners():
+    text = (
+        "Chair: There will be a short recess after public comment.\n"
+        "Chair: This will take about ten minutes.\n"
+        "Chair: It has to go through the planning board first."
+    )
+    items, confidence = rule_actions(text)
+    assert items == []
+    assert confidence == 1.0
+
+
+def test_named_owner_and_speaker_resolve_with_high_confidence():
+    text = (
+        "Chair: The Clerk will publish the rental assistance FAQ by Friday.\n"
+        "Alice: I will draft the zoning memo by next week."
+    )
+    items, confidence = rule_actions(text)
+    assert [item.owner for item in items] == ["Clerk", "Alice"]
+    assert confidence >= ESCALATION_THRESHOLD
+
+
+def test_pronoun_owner_is_unresolved_and_escalated():
+    items, confidence = rule_actions("Chair: They will send the audit report by Friday.")
+    assert [item.owner for item in items] == [""]
+    assert items[0].deadline == "Friday"
+    assert confidence < ESCALATION_THRESHOLD
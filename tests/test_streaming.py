@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from src.analysis import streaming
+from src.analysis.data_structures import ActionItem
+from src.analysis.streaming import StreamingMeetingSession
+from src.utils.text import IncrementalChunker, chunk_text
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_chunker_matches_chunk_text(seed):
+    rng = random.Random(seed)
+    max_chars = rng.randint(1, 60)
+    overlap = rng.randint(0, max_chars - 1)
+    text = "".join(rng.choice("ab c\né") for _ in range(rng.randint(0, 400)))
+
+    chunker = IncrementalChunker(max_chars=max_chars, overlap=overlap)
+    produced, pos = [], 0
+    while pos < len(text):
+        piece = text[pos : pos + rng.randint(1, 2 * max_chars)]
+        produced.extend(chunker.feed(piece))
+        pos += len(piece)
+    tail = chunker.flush()
+    if tail is not None:
+        produced.append(tail)
+    assert produced == chunk_text(text, max_chars=max_chars, overlap=overlap)
+    assert chunker.flush() is None
+
+
+@pytest.fixture
+def window_stages(monkeypatch):
+    """Stage functions that label their output with each window's offsets."""
+    monkeypatch.setattr(
+        streaming, "summarize_chunks", lambda chunks: [f"{c.start}-{c.end}" for c in chunks]
+    )
+    item = ActionItem(description="Clerk to post the agenda", owner="Clerk", deadline="", support="")
+    monkeypatch.setattr(streaming, "extract_actions_from_chunks", lambda chunks: [item for _ in chunks])
+    monkeypatch.setattr(streaming, "extract_decisions_from_chunks", lambda chunks: [])
+
+
+def test_provisional_tail_is_replaced_not_duplicated(window_stages):
+    session = StreamingMeetingSession(max_chars=40, overlap=0, max_latency=0.0)
+    first = session.add_utterance("Clerk: roll call")
+    assert first.agenda_summary == "0-16"
+    second = session.add_utterance("Chair: item 1")
+    assert second.agenda_summary == "0-30"
+
+    closed = session.add_utterance("Clerk: next item")
+    assert closed.agenda_summary == "0-40"  # closed window replaces the provisional tail
+    tail = session.poll()
+    assert tail.agenda_summary == "0-40 40-47"
+    final = session.finish()
+    assert final.agenda_summary == "0-40 40-47"
+
+
+def test_snapshot_dedupes_action_items_across_windows(window_stages):
+    session = StreamingMeetingSession(max_chars=20, overlap=5, max_latency=0.0)
+    for idx in range(6):
+        session.add_utterance(f"Speaker {idx}: agenda")
+    report = session.finish()
+    assert len(report.agenda_summary.split()) > 1
+    assert [(item.description, item.owner) for item in report.action_items] == [
+        ("Clerk to post the agenda", "Clerk")
+    ]
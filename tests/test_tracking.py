@@ -0,0 +1,69 @@
+from src.analysis.data_structures import ActionItem
+from src.analysis.tracking import ActionTracker, dedupe_action_items
+
+
+def test_dedupe_collapses_overlap_duplicates():
+    items = [
+        ActionItem("Publish the rental assistance FAQ for all districts", "", "", "quote"),
+        ActionItem("Publish the rental assistance FAQ for all districts.", "Staff", "Oct 22", ""),
+    ]
+    kept = dedupe_action_items(items)
+    assert len(kept) == 1
+    assert (kept[0].owner, kept[0].deadline, kept[0].support) == ("Staff", "Oct 22", "quote")
+
+
+def test_dedupe_keeps_items_that_differ_by_number():
+    items = [
+        ActionItem("Review the budget for Q3", "", "", ""),
+        ActionItem("Review the budget for Q4", "", "", ""),
+    ]
+    assert len(dedupe_action_items(items)) == 2
+
+
+def test_dedupe_keeps_items_with_different_owners_or_recipients():
+    owners = [
+        ActionItem("Send the report", "Alice", "Friday", ""),
+        ActionItem("Send the report", "Bob", "Monday", ""),
+    ]
+    assert [item.owner for item in dedupe_action_items(owners)] == ["Alice", "Bob"]
+    recipients = [
+        ActionItem("Send the report to Bob", "", "", ""),
+        ActionItem("Send the report to Alice", "", "", ""),
+    ]
+    assert len(dedupe_action_items(recipients)) == 2
+
+
+def test_dedupe_does_not_collapse_blank_descriptions():
+    items = [ActionItem("", "Alice", "", ""), ActionItem("", "Bob", "", "")]
+    assert len(dedupe_action_items(items)) == 2
+
+
+def test_tracker_links_restatements_and_records_changes(tmp_path):
+    tracker = ActionTracker()
+    tracker.update("m1", [ActionItem("Send the revised housing budget to the council", "Ana", "Friday", "")])
+    tracker.update("m2", [ActionItem("Send revised housing budget to council members", "Ben", "Monday", "")])
+    path = tmp_path / "tracker.json"
+    tracker.save(path)
+    (item,) = ActionTracker.load(path).items
+    assert (item.first_seen, item.last_seen, item.owner) == ("m1", "m2", "Ben")
+    assert item.deadline_slips == 1
+
+
+def test_tracker_keeps_items_that_differ_by_number():
+    tracker = ActionTracker()
+    tracker.update("m1", [ActionItem("Review the budget for Q3", "", "", "")])
+    tracker.update("m2", [ActionItem("Review the budget for Q4", "", "", "")])
+    tracker.update(
+        "m2",
+        [
+            ActionItem("Send item 12 to the clerk", "", "", ""),
+            ActionItem("Send item 13 to the clerk", "", "", ""),
+        ],
+    )
+    assert [item.description for item in tracker.items] == [
+        "Review the budget for Q3",
+        "Review the budget for Q4",
+        "Send item 12 to the clerk",
+        "Send item 13 to the clerk",
+    ]
+    assert [item.meetings for item in tracker.items] == [["m1"], ["m2"], ["m2"], ["m2"]]
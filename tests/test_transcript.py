@@ -0,0 +1,18 @@
+import pytest
+
+from src.analysis.transcript import INFLIGHT_BATCHES, summarize_chunks
+from src.utils.model_registry import BATCHING, batching_stats
+from src.utils.text import iter_chunks
+
+
+# Slow enough that an unbounded stage would queue every chunk before the first batch ends
+@pytest.mark.parametrize("stub_registry", [{"base_ms": 20}], ids=["slow"], indirect=True)
+def test_submissions_in_flight_are_bounded(stub_registry):
+    transcript = "\n".join(f"Speaker {idx % 5}: the council reviewed item {idx}" for idx in range(400))
+    chunks = list(iter_chunks(transcript, max_chars=120, overlap=0))
+    summaries = summarize_chunks(chunks)
+    assert len(summaries) == len(chunks)
+    assert summaries[0].startswith("Speaker 0: the council reviewed item 0")
+    limit = INFLIGHT_BATCHES * BATCHING["summarizer"]["max_batch_size"]
+    assert len(chunks) > 2 * limit
+    assert batching_stats()["summarizer"].max_queue_depth <= limit
@@ -0,0 +1,56 @@
+import pytest
+from PIL import Image
+
+from src.analysis import vision
+from src.analysis.vision import ImageRejected, preprocess_image
+
+
+def _two_tone(path, size, orientation=None):
+    """Left half red, right half blue; optionally tagged with an EXIF orientation."""
+    width, height = size
+    img = Image.new("RGB", size, "blue")
+    img.paste("red", (0, 0, width // 2, height))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[0x0112] = orientation
+    img.save(path, exif=exif)
+    return path
+
+
+def _is_red(pixel):
+    red, green, blue = pixel
+    return red > 200 and green < 60 and blue < 60
+
+
+def test_exif_orientation_is_applied(tmp_path):
+    path = _two_tone(tmp_path / "rotated.jpg", (1200, 600), orientation=6)
+    out = preprocess_image(path)
+    # Orientation 6 means the camera was turned clockwise: the left half ends up on top
+    assert out.size == (384, 768)
+    assert _is_red(out.getpixel((192, 10)))
+    assert not _is_red(out.getpixel((192, 758)))
+
+
+def test_downscales_shorter_side_to_caption_input(tmp_path):
+    out = preprocess_image(_two_tone(tmp_path / "slide.png", (2000, 1000)))
+    assert out.size == (768, 384)
+    assert out.mode == "RGB"
+
+
+def test_small_images_are_not_upscaled(tmp_path):
+    out = preprocess_image(_two_tone(tmp_path / "thumb.png", (100, 50)))
+    assert out.size == (100, 50)
+
+
+def test_rejects_images_above_pixel_limit(tmp_path, monkeypatch):
+    path = _two_tone(tmp_path / "big.png", (100, 100))
+    monkeypatch.setattr(vision, "MAX_IMAGE_PIXELS", 100 * 100 - 1)
+    with pytest.raises(ImageRejected, match="pixels"):
+        preprocess_image(path)
+
+
+def test_rejects_files_above_byte_limit(tmp_path, monkeypatch):
+    path = _two_tone(tmp_path / "heavy.png", (100, 100))
+    monkeypatch.setattr(vision, "MAX_IMAGE_BYTES", path.stat().st_size - 1)
+    with pytest.raises(ImageRejected, match="MiB"):
+        preprocess_image(path)